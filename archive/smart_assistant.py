@@ -9,13 +9,19 @@ import sys
 import argparse
 import subprocess
 import json
+import threading
+import time
 import re
+import fnmatch
+import stat
+from collections import OrderedDict, deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
-from datetime import datetime
 
 try:
-    from llama_cpp import Llama
+    from llama_cpp import Llama, LlamaRAMCache
     LLAMA_AVAILABLE = True
 except ImportError:
     LLAMA_AVAILABLE = False
@@ -25,6 +31,7 @@ try:
     from rich.console import Console
     from rich.prompt import Prompt, Confirm
     from rich.panel import Panel
+    from rich.live import Live
     from rich.markdown import Markdown
     from rich.syntax import Syntax
     from rich.tree import Tree
@@ -33,13 +40,124 @@ except ImportError:
     RICH_AVAILABLE = False
     print("Warning: rich not installed. Terminal output will be plain.")
 
+# Conversation messages (user + assistant) sent with each prompt, i.e. last 5 exchanges
+_CONVERSATION_HISTORY_SIZE = 10
+
+# Number of most recent tool executions kept in SmartToolManager.execution_history
+_EXECUTION_HISTORY_SIZE = 256
+
+# Maximum number of file reads memoized by SmartToolManager.tool_read_file
+_READ_CACHE_SIZE = 64
+
+# Candidate file paths mentioned in a prompt (compiled once; used on every turn)
+_FILE_PATH_RE = re.compile(r'[/\\]?[\w\-./\\]+\.?\w*')
+
+# Intent keywords used to decide which tools a prompt needs
+_TOOL_KEYWORDS = (
+    'create', 'write', 'read', 'file', 'directory', 'folder',
+    'run', 'execute', 'test', 'check', 'list', 'show',
+    'git', 'commit', 'status', 'add', 'push', 'pull',
+    'build', 'compile', 'install', 'setup'
+)
+# All keywords in one pass; anchored at a word start so inflections ("files",
+# "running") still match but embedded hits ("unread", "spreadsheet") do not
+_TOOL_KEYWORDS_RE = re.compile(r'\b(?:' + '|'.join(_TOOL_KEYWORDS) + ')', re.IGNORECASE)
+_READ_INTENT_WORDS = ('read', 'show', 'summarize', 'analyze', 'explain')
+_WRITE_INTENT_WORDS = ('write', 'create', 'modify')
+
+# Substrings that block tool_run_command, matched case-insensitively in one pass
+_DANGEROUS_COMMAND_PATTERNS = (
+    # Command chaining and piping
+    '&&', '||', ';', '|',
+    # Redirection and substitution
+    '>>', '<<', '>', '<', '$(', '$', '`',
+    # Common dangerous commands
+    'rm -rf', 'sudo', 'chmod 777', 'format', 'del',
+    'mkfs', 'dd ', 'fallocate', 'truncate',
+    # Shell builtins that can be dangerous
+    'exec', 'eval', 'source', '. ',
+)
+_DANGEROUS_COMMAND_RE = re.compile(
+    '|'.join(map(re.escape, _DANGEROUS_COMMAND_PATTERNS)), re.IGNORECASE
+)
+
+# Per-stream cap on captured tool subprocess output; the rest is drained and dropped
+_MAX_TOOL_OUTPUT = 1 << 20
+
+def _run_bounded(args, timeout, cwd, env, limit=_MAX_TOOL_OUTPUT):
+    """Run args like subprocess.run(capture_output=True, text=True), keeping at most
+    limit bytes of each stream so a chatty child cannot exhaust memory.
+
+    Returns (returncode, stdout, stderr). Raises subprocess.TimeoutExpired after
+    killing the child if it outlives timeout.
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd, env=env)
+    captured = {}
+
+    def drain(name, pipe):
+        kept = bytearray()
+        with pipe:
+            for chunk in iter(lambda: pipe.read(65536), b""):
+                if len(kept) < limit:
+                    kept += chunk[:limit - len(kept)]
+        captured[name] = kept.decode("utf-8", errors="replace")
+
+    readers = [threading.Thread(target=drain, args=("stdout", proc.stdout), daemon=True),
+               threading.Thread(target=drain, args=("stderr", proc.stderr), daemon=True)]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+    return returncode, captured["stdout"], captured["stderr"]
+
+# libyaml's C loader when available; same results as safe_load, several times faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+@lru_cache(maxsize=8)
+def _load_yaml_config(path, mtime_ns):
+    """Parse a YAML config file; cached until the file's mtime changes.
+
+    The returned mapping is shared between callers and must be treated as read-only.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+@lru_cache(maxsize=None)
+def _tool_names(cls):
+    """Sorted tool names defined on a tool manager class (tools are fixed per class)."""
+    return tuple(sorted(
+        attr_name[5:] for attr_name in dir(cls)
+        if attr_name.startswith('tool_') and callable(getattr(cls, attr_name))
+    ))
+
+class _StreamingPanel:
+    """Live renderable that re-renders the streamed text only when rich refreshes."""
+
+    def __init__(self, title):
+        self.title = title
+        self.parts = []
+
+    def __rich__(self):
+        return Panel(Markdown("".join(self.parts)), title=self.title)
+
 class SmartToolManager:
     """Improved tool manager with better result handling."""
 
     def __init__(self, console=None):
         self.console = console
         self.working_directory = Path.cwd()
-        self.execution_history = []
+        self.execution_history = deque(maxlen=_EXECUTION_HISTORY_SIZE)
+        # resolved path -> (mtime_ns, size, result); LRU order, invalidated on write
+        self._read_cache = OrderedDict()
+        # Context files are read on a thread pool; guards the cache's LRU bookkeeping
+        self._read_cache_lock = threading.Lock()
 
     def execute_tool(self, tool_name, tool_args):
         """Execute a tool and return detailed results."""
@@ -50,12 +168,12 @@ class SmartToolManager:
         try:
             result = tool_function(**tool_args)
 
-            # Add execution to history
+            # Add execution to history (epoch ns; format only when displayed)
             self.execution_history.append({
                 "tool": tool_name,
                 "args": tool_args,
                 "result": result,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time_ns()
             })
 
             # Ensure result has output field for AI to use
@@ -91,19 +209,40 @@ class SmartToolManager:
             if not self._is_path_safe(str(resolved_path)):
                 return {"success": False, "error": f"Forbidden path: {file_path}", "output": ""}
 
-            if not resolved_path.exists():
+            try:
+                st = resolved_path.stat()
+            except FileNotFoundError:
                 return {"success": False, "error": f"File not found: {file_path}", "output": ""}
 
-            with open(resolved_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            return {
+            # Serve unchanged files from the cache
+            cache_key = str(resolved_path)
+            with self._read_cache_lock:
+                cached = self._read_cache.get(cache_key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    self._read_cache.move_to_end(cache_key)
+                    return dict(cached[2])
+
+            # One read and one decode instead of TextIOWrapper's incremental decoding;
+            # newlines are normalized the way text mode would
+            content = resolved_path.read_bytes().decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+            result = {
                 "success": True,
                 "content": content,
                 "size": len(content),
-                "lines": len(content.splitlines()),
+                # Count newlines in C instead of materializing a list of lines
+                "lines": content.count('\n') + (not content.endswith('\n') if content else 0),
                 "output": content  # Important: Include content in output for AI
             }
+
+            with self._read_cache_lock:
+                self._read_cache[cache_key] = (st.st_mtime_ns, st.st_size, result)
+                if len(self._read_cache) > _READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+
+            return dict(result)
         except Exception as e:
             return {"success": False, "error": str(e), "output": ""}
 
@@ -118,9 +257,40 @@ class SmartToolManager:
                 return {"success": False, "error": f"Forbidden path: {file_path}", "output": ""}
 
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(resolved_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with self._read_cache_lock:
+                self._read_cache.pop(str(resolved_path), None)
+
+            # Encode once, write with raw syscalls to a sibling temp file, then
+            # rename over the target so readers never see a half-written file.
+            # resolve() has already followed symlinks, so the rename replaces the
+            # real file and any link to it keeps pointing at the new content.
+            if os.linesep != '\n':
+                data = content.replace('\n', os.linesep).encode('utf-8')
+            else:
+                data = content.encode('utf-8')
+            try:
+                mode = stat.S_IMODE(resolved_path.stat().st_mode)
+            except FileNotFoundError:
+                mode = None
+            tmp_path = resolved_path.with_name(resolved_path.name + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                # Keep the permissions (e.g. +x) of the file being replaced
+                if mode is not None:
+                    os.chmod(tmp_path, mode)
+                os.replace(tmp_path, resolved_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             return {
                 "success": True,
@@ -163,23 +333,35 @@ class SmartToolManager:
             if not resolved_path.exists():
                 return {"success": False, "error": f"Directory not found: {directory}", "output": ""}
 
-            files = list(resolved_path.glob(pattern))
             file_list = []
 
-            for file in files:
-                if file.is_file():
-                    file_list.append({
-                        "name": file.name,
-                        "path": str(file),
-                        "size": file.stat().st_size
-                    })
-
-            output = f"Files in {directory}:\n"
-            for file in file_list[:10]:  # Limit to 10 files
-                output += f"  • {file['name']} ({file['size']} bytes)\n"
+            if '/' in pattern or '\\' in pattern:
+                # Recursive or nested patterns need full glob semantics
+                for file in resolved_path.glob(pattern):
+                    if file.is_file():
+                        file_list.append({
+                            "name": file.name,
+                            "path": str(file),
+                            "size": file.stat().st_size
+                        })
+            else:
+                # Single-level listing: scandir entries carry their file type,
+                # so no Path objects or extra is_file() stats are needed
+                with os.scandir(resolved_path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and (pattern == "*" or fnmatch.fnmatch(entry.name, pattern)):
+                            file_list.append({
+                                "name": entry.name,
+                                "path": entry.path,
+                                "size": entry.stat().st_size
+                            })
+
+            parts = [f"Files in {directory}:\n"]
+            parts.extend(f"  • {file['name']} ({file['size']} bytes)\n" for file in file_list[:10])  # Limit to 10 files
 
             if len(file_list) > 10:
-                output += f"  ... and {len(file_list) - 10} more files"
+                parts.append(f"  ... and {len(file_list) - 10} more files")
+            output = "".join(parts)
 
             return {
                 "success": True,
@@ -236,32 +418,21 @@ class SmartToolManager:
                 if not self._is_path_safe(str(full_path)):
                     return {"success": False, "error": f"File path outside safe directory: {file_path}", "output": ""}
 
-                result = subprocess.run(
-                    [sys.executable, str(full_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    cwd=self.working_directory,
-                    # Restricted environment for security
-                    env=self._get_restricted_python_env()
-                )
+                args = [sys.executable, str(full_path)]
             else:
-                result = subprocess.run(
-                    [sys.executable, "-c", code_to_check],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    cwd=self.working_directory,
-                    # Restricted environment for security
-                    env=self._get_restricted_python_env()
-                )
-
-            output = result.stdout if result.returncode == 0 else result.stderr
+                args = [sys.executable, "-c", code_to_check]
+
+            # Restricted environment for security
+            returncode, stdout, stderr = _run_bounded(
+                args, timeout, self.working_directory, self._get_restricted_python_env()
+            )
+
+            output = stdout if returncode == 0 else stderr
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
+                "success": returncode == 0,
+                "stdout": stdout,
+                "stderr": stderr,
+                "returncode": returncode,
                 "output": output.strip()
             }
         except subprocess.TimeoutExpired:
@@ -283,23 +454,10 @@ class SmartToolManager:
         - Run in isolated environment when possible
         """
         try:
-            # Enhanced safety checks for dangerous patterns
-            dangerous_patterns = [
-                # Command chaining and piping
-                '&&', '||', ';', '|',
-                # Redirection and substitution
-                '>', '<', '>>', '<<', '$', '`', '$(',
-                # Common dangerous commands
-                'rm -rf', 'sudo', 'chmod 777', 'format', 'del',
-                'mkfs', 'dd ', 'fallocate', 'truncate',
-                # Shell builtins that can be dangerous
-                'exec', 'eval', 'source', '. ',
-            ]
-
-            command_lower = command.lower()
-            for pattern in dangerous_patterns:
-                if pattern in command_lower:
-                    return {"success": False, "error": f"Command blocked: dangerous pattern '{pattern}' detected", "output": ""}
+            # Enhanced safety checks for dangerous patterns (single regex pass)
+            danger = _DANGEROUS_COMMAND_RE.search(command)
+            if danger:
+                return {"success": False, "error": f"Command blocked: dangerous pattern '{danger.group(0).lower()}' detected", "output": ""}
 
             # Parse command into arguments for better security
             import shlex
@@ -322,23 +480,19 @@ class SmartToolManager:
             print(f"[AUDIT] Executing command: {command}")
 
             # Use subprocess with argument list (no shell=True) for better security
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.working_directory,
+            returncode, stdout, stderr = _run_bounded(
+                args, timeout, self.working_directory,
                 # Clean environment to avoid shell profile issues
-                env={k: v for k, v in os.environ.items()
-                     if k not in ['BASH_ENV', 'ENV', 'SHELL']}
+                {k: v for k, v in os.environ.items()
+                 if k not in ['BASH_ENV', 'ENV', 'SHELL']}
             )
 
-            output = result.stdout if result.returncode == 0 else result.stderr
+            output = stdout if returncode == 0 else stderr
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
+                "success": returncode == 0,
+                "stdout": stdout,
+                "stderr": stderr,
+                "returncode": returncode,
                 "output": output.strip()
             }
         except subprocess.TimeoutExpired:
@@ -352,7 +506,7 @@ class SmartToolManager:
         """Get git repository status."""
         try:
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain=v1", "-z"],
                 capture_output=True,
                 text=True,
                 cwd=self.working_directory
@@ -361,16 +515,22 @@ class SmartToolManager:
             if result.returncode != 0:
                 return {"success": False, "error": "Not a git repository", "output": ""}
 
+            if not result.stdout:
+                return {"success": True, "changed_files": [], "output": "Git Status: 0 changed files"}
+
+            # NUL-separated records keep paths with spaces/newlines intact; a rename
+            # or copy is followed by an extra record holding the original path
             changed_files = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    status = line[:2]
-                    file_path = line[3:]
-                    changed_files.append({"status": status, "file": file_path})
+            records = iter(result.stdout.split('\0'))
+            for record in records:
+                if record:
+                    changed_files.append({"status": record[:2], "file": record[3:]})
+                    if record[0] in 'RC':
+                        next(records, None)
 
-            output = f"Git Status: {len(changed_files)} changed files\n"
-            for file in changed_files[:10]:
-                output += f"  {file['status']} {file['file']}\n"
+            parts = [f"Git Status: {len(changed_files)} changed files\n"]
+            parts.extend(f"  {file['status']} {file['file']}\n" for file in changed_files[:10])
+            output = "".join(parts)
 
             return {
                 "success": True,
@@ -382,62 +542,71 @@ class SmartToolManager:
 
     def get_available_tools(self):
         """Return a list of all available tools."""
-        tools = []
-        for attr_name in dir(self):
-            if attr_name.startswith('tool_'):
-                tool_name = attr_name[5:]
-                method = getattr(self, attr_name)
-                if callable(method):
-                    tools.append(tool_name)
-        return sorted(tools)
+        return list(_tool_names(type(self)))
 
 class SmartAIAssistant:
     """Improved AI Assistant with better conversation handling."""
 
     def __init__(self, model_path=None, config_path=None):
         self.console = Console() if RICH_AVAILABLE else None
+        self._bind_printers()
         self.model = None
+        self._model_loader = None  # background thread started by load_model(background=True)
+        self._model_error = None  # exception raised by the background load, if any
         self.config = self.load_config(config_path)
         self.model_path = model_path or self.config.get('model', {}).get('path', 'models/Qwen2.5-Coder-7B-Instruct-Q4_K_M.gguf')
         self.context_files = []
         self.tool_manager = SmartToolManager(self.console)
         self.auto_confirm = False
-        self.conversation_history = []  # Track conversation for better context
+        # Track conversation for better context; older messages fall off automatically
+        self.conversation_history = deque(maxlen=_CONVERSATION_HISTORY_SIZE)
+
+        # Constant system prompt; per-turn tool/file context is sent with the user message
+        self._system_message = f"""You are a helpful AI assistant that can analyze code and assist with technical tasks.
+
+Guidelines:
+1. Answer questions directly and accurately
+2. If tool results or files are provided with a message, use them in your response
+3. Be concise but thorough
+4. If you need to perform actions, ask for permission first
+5. Focus on what the user actually asked for
+
+Available tools: {', '.join(self.tool_manager.get_available_tools())}
+Use tools only when explicitly requested."""
 
     def load_config(self, config_path):
         """Load configuration from YAML file."""
         if config_path and Path(config_path).exists():
             try:
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                path = os.path.abspath(config_path)
+                return _load_yaml_config(path, os.stat(path).st_mtime_ns)
             except Exception as e:
                 self.print_error(f"Failed to load config: {e}")
                 return {}
         return {}
 
-    def print_message(self, message, style=None):
-        """Print a message with rich formatting if available."""
-        if self.console:
-            self.console.print(message, style=style)
+    def _bind_printers(self):
+        """Bind print_message/print_error/print_success/print_warning for the output
+        backend chosen at startup, so the hot output path skips the console check."""
+        console = self.console
+        if console:
+            self.print_message = lambda message, style=None: console.print(message, style=style)
+            self.print_error = lambda message: console.print(f"❌ {message}", style="red")
+            self.print_success = lambda message: console.print(f"✅ {message}", style="green")
+            self.print_warning = lambda message: console.print(f"⚠️  {message}", style="yellow")
         else:
-            print(message)
+            self.print_message = lambda message, style=None: print(message)
+            self.print_error = lambda message: print(f"ERROR: {message}")
+            self.print_success = lambda message: print(f"SUCCESS: {message}")
+            self.print_warning = lambda message: print(f"WARNING: {message}")
 
-    def print_error(self, message):
-        """Print an error message."""
-        if self.console:
-            self.console.print(f"❌ {message}", style="red")
-        else:
-            print(f"ERROR: {message}")
+    def load_model(self, background=False):
+        """Load the local language model.
 
-    def print_success(self, message):
-        """Print a success message."""
-        if self.console:
-            self.console.print(f"✅ {message}", style="green")
-        else:
-            print(f"SUCCESS: {message}")
-
-    def load_model(self):
-        """Load the local language model."""
+        With background=True the file checks run immediately but the model itself
+        is constructed on a worker thread; generate_response waits for it on first use
+        and raises RuntimeError if the load failed.
+        """
         if not LLAMA_AVAILABLE:
             self.print_error("llama-cpp-python not installed")
             return False
@@ -447,31 +616,62 @@ class SmartAIAssistant:
             self.print_error(f"Model file not found: {self.model_path}")
             return False
 
-        try:
-            self.print_message(f"🧠 Loading model: {model_file.name}")
-            self.model = Llama(
-                model_path=str(model_file),
-                n_ctx=self.config.get('model', {}).get('context_length', 4096),
-                n_threads=self.config.get('model', {}).get('threads', 0),
-                temperature=self.config.get('model', {}).get('temperature', 0.3),  # Lower temperature for more reliable responses
-                verbose=False
-            )
-            self.print_success("Model loaded successfully!")
+        self.print_message(f"🧠 Loading model: {model_file.name}")
+        if background:
+            self._model_loader = threading.Thread(target=self._load_model_in_background, args=(model_file,), daemon=True)
+            self._model_loader.start()
             return True
+        try:
+            self._construct_model(model_file)
         except Exception as e:
             self.print_error(f"Failed to load model: {e}")
             return False
+        self.print_success("Model loaded successfully!")
+        return True
+
+    def _load_model_in_background(self, model_file):
+        """Loader thread body; records the outcome instead of printing over the prompt."""
+        try:
+            self._construct_model(model_file)
+        except Exception as e:
+            self._model_error = e
+
+    def wait_for_model(self):
+        """Wait for a background load to finish; return True if a model is available.
+
+        Raises RuntimeError if the background load failed.
+        """
+        if self._model_loader:
+            self._model_loader.join()
+            self._model_loader = None
+            if self._model_error is None:
+                self.print_success("Model loaded successfully!")
+        if self._model_error is not None:
+            raise RuntimeError(f"Failed to load model: {self._model_error}")
+        return self.model is not None
+
+    def _construct_model(self, model_file):
+        """Build the Llama instance; weights are mmapped and paged in on first use."""
+        model = Llama(
+            model_path=str(model_file),
+            n_ctx=self.config.get('model', {}).get('context_length', 4096),
+            # 0/unset lets llama.cpp pick its own thread count from the CPU topology
+            n_threads=self.config.get('model', {}).get('threads', 0) or None,
+            temperature=self.config.get('model', {}).get('temperature', 0.3),  # Lower temperature for more reliable responses
+            use_mmap=True,
+            use_mlock=False,
+            verbose=False
+        )
+        # Opt-in: keep earlier evaluated prompt states (llama.cpp already reuses the
+        # prefix shared with the previous call; this copies the KV state every call)
+        cache_mb = self.config.get('model', {}).get('prompt_cache_mb', 0)
+        if cache_mb:
+            model.set_cache(LlamaRAMCache(capacity_bytes=cache_mb << 20))
+        self.model = model
 
     def should_use_tools(self, user_input):
         """Determine if tools are needed for this request."""
-        tool_keywords = [
-            'create', 'write', 'read', 'file', 'directory', 'folder',
-            'run', 'execute', 'test', 'check', 'list', 'show',
-            'git', 'commit', 'status', 'add', 'push', 'pull',
-            'build', 'compile', 'install', 'setup'
-        ]
-
-        return any(keyword in user_input.lower() for keyword in tool_keywords)
+        return _TOOL_KEYWORDS_RE.search(user_input) is not None
 
     def execute_tools_intelligently(self, user_input, max_tools=3):
         """Execute tools intelligently based on user intent."""
@@ -482,27 +682,30 @@ class SmartAIAssistant:
         tools_to_execute = []
         user_lower = user_input.lower()
 
+        # Look for file paths in the input (shared by the read and write branches).
+        # Drop tokens that cannot be paths and duplicates before touching the
+        # filesystem, so each candidate is stat'ed at most once per prompt.
+        candidates = dict.fromkeys(
+            token for token in _FILE_PATH_RE.findall(user_input)
+            if '.' in token or '/' in token or '\\' in token
+        )
+        file_paths = [file_path for file_path in candidates if Path(file_path).exists()]
+
         # File reading
-        if any(word in user_lower for word in ['read', 'show', 'summarize', 'analyze', 'explain']):
-            # Look for file paths in the input
-            file_paths = re.findall(r'[/\\]?[\w\-./\\]+\.?\w*', user_input)
+        if any(word in user_lower for word in _READ_INTENT_WORDS):
             for file_path in file_paths:
-                if Path(file_path).exists():
-                    tools_to_execute.append(('read_file', {'file_path': file_path}))
-                    if len(tools_to_execute) >= max_tools:
-                        break
+                tools_to_execute.append(('read_file', {'file_path': file_path}))
+                if len(tools_to_execute) >= max_tools:
+                    break
 
         # File writing - Only execute if we have content from previous reads
-        if any(word in user_lower for word in ['write', 'create', 'modify']) and 'file' in user_lower:
-            # Look for file paths in the input
-            file_paths = re.findall(r'[/\\]?[\w\-./\\]+\.?\w*', user_input)
+        if any(word in user_lower for word in _WRITE_INTENT_WORDS) and 'file' in user_lower:
             for file_path in file_paths:
                 # Only write if we have content to write (simplified approach)
                 # For now, just read the file to see current content
-                if Path(file_path).exists():
-                    tools_to_execute.append(('read_file', {'file_path': file_path}))
-                    if len(tools_to_execute) >= max_tools:
-                        break
+                tools_to_execute.append(('read_file', {'file_path': file_path}))
+                if len(tools_to_execute) >= max_tools:
+                    break
 
         # Execute at most max_tools tools
         results = []
@@ -528,9 +731,13 @@ class SmartAIAssistant:
 
         return results
 
-    def generate_response(self, prompt):
-        """Generate a response with improved context handling."""
-        if not self.model:
+    def generate_response(self, prompt, on_token=None):
+        """Generate a response with improved context handling.
+
+        If on_token is given, the completion is streamed and on_token is
+        called with each text fragment as the model produces it.
+        """
+        if not self.wait_for_model():
             self.print_error("Model not loaded")
             return ""
 
@@ -542,57 +749,61 @@ class SmartAIAssistant:
         tool_context = ""
 
         if tool_results:
-            tool_context = "\n\nTool Results:\n"
-            for tool_result in tool_results:
-                tool_result_data = tool_result["result"]
-                if tool_result_data["success"] and tool_result_data.get("output"):
-                    tool_context += f"[{tool_result['tool']}]: {tool_result_data['output']}\n"
-            tool_context += "\n"
-
-        # Create context from files
-        file_context = ""
-        for file_path in self.context_files:
-            content = self.tool_manager.execute_tool("read_file", {"file_path": str(file_path)})
-            if content["success"]:
-                file_context += f"\n--- File: {file_path} ---\n{content['output']}\n--- End of File ---\n"
-
-        # Build system prompt with context
-        system_message = f"""You are a helpful AI assistant that can analyze code and assist with technical tasks.
-
-{tool_context if tool_context else ""}
-
-{file_context if file_context else ""}
-
-Guidelines:
-1. Answer questions directly and accurately
-2. If tool results are provided above, use them in your response
-3. Be concise but thorough
-4. If you need to perform actions, ask for permission first
-5. Focus on what the user actually asked for
+            tool_context = "".join([
+                "\n\nTool Results:\n",
+                *(f"[{tool_result['tool']}]: {tool_result['result']['output']}\n"
+                  for tool_result in tool_results
+                  if tool_result["result"]["success"] and tool_result["result"].get("output")),
+                "\n"
+            ])
+
+        # Create context from files (read concurrently; file reads release the GIL)
+        def read_context_file(file_path):
+            return self.tool_manager.execute_tool("read_file", {"file_path": str(file_path)})
+
+        if len(self.context_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.context_files))) as executor:
+                contents = list(executor.map(read_context_file, self.context_files))
+        else:
+            contents = [read_context_file(file_path) for file_path in self.context_files]
 
-Available tools: {', '.join(self.tool_manager.get_available_tools())}
-Use tools only when explicitly requested."""
+        file_context = "".join(
+            f"\n--- File: {file_path} ---\n{content['output']}\n--- End of File ---\n"
+            for file_path, content in zip(self.context_files, contents)
+            if content["success"]
+        )
 
-        # Create messages for chat completion
-        messages = [
-            {"role": "system", "content": system_message}
-        ]
+        # The system prompt and earlier turns come first and are sent unchanged, so
+        # llama.cpp can reuse their evaluated prefix (up to the system prompt only once
+        # the history deque starts dropping old turns); the per-turn tool/file context
+        # goes into the newest user message at the end
+        messages = [{"role": "system", "content": self._system_message}]
 
-        # Add recent conversation history (last 5 exchanges)
-        for exchange in self.conversation_history[-10:]:
-            messages.append(exchange)
+        # Add recent conversation history (bounded by the deque's maxlen)
+        messages.extend(self.conversation_history)
+        if tool_context or file_context:
+            messages[-1] = {"role": "user", "content": "".join((tool_context, "\n\n", file_context, "\n\n", prompt)).lstrip()}
 
         try:
             self.print_message("🤔 Thinking...")
 
-            response = self.model.create_chat_completion(
-                messages,
-                max_tokens=self.config.get('model', {}).get('max_tokens', 2048),
-                temperature=self.config.get('model', {}).get('temperature', 0.3),
-                stop=["<|im_end|>"]
-            )
+            completion_args = {
+                "max_tokens": self.config.get('model', {}).get('max_tokens', 2048),
+                "temperature": self.config.get('model', {}).get('temperature', 0.3),
+                "stop": ["<|im_end|>"]
+            }
 
-            ai_response = response['choices'][0]['message']['content'].strip()
+            if on_token is None:
+                response = self.model.create_chat_completion(messages, **completion_args)
+                ai_response = response['choices'][0]['message']['content'].strip()
+            else:
+                parts = []
+                for chunk in self.model.create_chat_completion(messages, stream=True, **completion_args):
+                    token = chunk['choices'][0]['delta'].get('content')
+                    if token:
+                        parts.append(token)
+                        on_token(token)
+                ai_response = "".join(parts).strip()
 
             # Add AI response to conversation history
             self.conversation_history.append({"role": "assistant", "content": ai_response})
@@ -603,6 +814,38 @@ Use tools only when explicitly requested."""
             self.print_error(f"Generation failed: {e}")
             return "I apologize, but I encountered an error generating a response."
 
+    def stream_response(self, prompt):
+        """Generate a response, displaying it token by token as it arrives."""
+        # Settle a background model load before the response header is drawn
+        self.wait_for_model()
+        if self.console:
+            panel = _StreamingPanel("🤖 Smart AI Response")
+            live = Live(panel, console=self.console, refresh_per_second=10)
+
+            # Start the live display on the first token: the tool phase before it
+            # may ask for confirmation, which a running Live would draw over
+            def add_token(token):
+                if not live.is_started:
+                    live.start()
+                panel.parts.append(token)
+
+            try:
+                return self.generate_response(prompt, on_token=add_token)
+            finally:
+                live.stop()
+
+        print("\n" + "="*50)
+        print("SMART AI RESPONSE:")
+        print("="*50)
+
+        def write_token(token):
+            sys.stdout.write(token)
+            sys.stdout.flush()
+
+        response = self.generate_response(prompt, on_token=write_token)
+        print("\n" + "="*50 + "\n")
+        return response
+
     def display_response(self, response):
         """Display the model response."""
         if not response:
@@ -621,13 +864,6 @@ Use tools only when explicitly requested."""
             print(response)
             print("="*50 + "\n")
 
-    def print_warning(self, message):
-        """Print a warning message."""
-        if self.console:
-            self.console.print(f"⚠️  {message}", style="yellow")
-        else:
-            print(f"WARNING: {message}")
-
     def interactive_mode(self):
         """Run in interactive mode."""
         self.print_message("🚀 Smart AI Assistant - Interactive Mode")
@@ -667,9 +903,8 @@ Use tools only when explicitly requested."""
                     self.handle_command(prompt)
                     continue
 
-                # Generate and display response
-                response = self.generate_response(prompt)
-                self.display_response(response)
+                # Generate and display response as it streams in
+                self.stream_response(prompt)
 
             except KeyboardInterrupt:
                 self.print_message("\n👋 Goodbye!")
@@ -881,7 +1116,7 @@ def main():
         assistant.auto_confirm = True
 
     # Load model
-    if not assistant.load_model():
+    if not assistant.load_model(background=True):
         sys.exit(1)
 
     # Add files to context
@@ -889,14 +1124,20 @@ def main():
         for file_path in args.files:
             assistant.context_files.append(Path(file_path))
 
-    # Single prompt mode
-    if args.prompt:
-        response = assistant.generate_response(args.prompt)
-        assistant.display_response(response)
-        return
+    try:
+        # Single prompt mode
+        if args.prompt:
+            assistant.stream_response(args.prompt)
+            return
 
-    # Interactive mode
-    assistant.interactive_mode()
+        # Interactive mode
+        assistant.interactive_mode()
+    except RuntimeError as e:
+        if assistant._model_error is None:
+            raise
+        # The model failed to load on the background thread
+        assistant.print_error(str(e))
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,6 +9,7 @@ import sys
 import subprocess
 import platform
 import importlib.util
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 import json
 
@@ -169,24 +170,28 @@ def verify_aider_installation():
     print("=" * 50)
 
     try:
-        # Try to run aider --version
-        result = subprocess.run(
-            [sys.executable, "-m", "aider", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            print(f"✅ Aider version: {result.stdout.strip()}")
-        else:
-            print("⚠️  Aider installed but version check failed")
-            print(f"Output: {result.stderr}")
-    except subprocess.TimeoutExpired:
-        print("⚠️  Aider version check timed out")
-    except FileNotFoundError:
-        print("❌ Aider installation verification failed")
-        return False
+        # Read the version from package metadata; avoids spawning and importing aider
+        print(f"✅ Aider version: {version('aider-chat')}")
+    except PackageNotFoundError:
+        # No metadata (e.g. source checkout) - fall back to asking aider itself
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "aider", "--version"],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode == 0:
+                print(f"✅ Aider version: {result.stdout.strip()}")
+            else:
+                print("⚠️  Aider installed but version check failed")
+                print(f"Output: {result.stderr}")
+        except subprocess.TimeoutExpired:
+            print("⚠️  Aider version check timed out")
+        except FileNotFoundError:
+            print("❌ Aider installation verification failed")
+            return False
 
     # Check if we can import aider modules
     try:
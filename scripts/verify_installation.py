@@ -4,29 +4,166 @@ Installation Verification Script for Offline Coding Agent
 Verifies that all components are properly installed and configured.
 """
 
+import argparse
+import hashlib
+import io
 import os
 import sys
+import threading
+import shutil
 import subprocess
+import tempfile
+import importlib.metadata
 import importlib.util
 import platform
 from pathlib import Path
 import json
-import yaml
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+_GIB = 1 << 30  # bytes per gibibyte
+_GGUF_MAGIC = b"GGUF"
+
+# (import name, distribution name) pairs checked by verify_python_environment
+_REQUIRED_PACKAGES = (
+    ("llama_cpp", "llama-cpp-python"),
+    ("rich", "rich"),
+    ("click", "click"),
+    ("yaml", "pyyaml"),
+    ("requests", "requests"),
+    ("tqdm", "tqdm"),
+)
+
+_OPTIONAL_PACKAGES = (
+    ("psutil", "psutil"),
+    ("git", "gitpython"),
+    ("watchdog", "watchdog"),
+    ("colorama", "colorama"),
+)
+
+# os.path.isfile skips Path method dispatch and takes the fast attribute path on Windows
+_isfile = os.path.isfile
+
+
+@lru_cache(maxsize=None)
+def _cached_find_spec(name):
+    """Memoized importlib.util.find_spec; spec lookups walk sys.path on every call."""
+    return importlib.util.find_spec(name)
+
+
+def _installed_distributions():
+    """Return normalized names of all installed distributions in one metadata scan."""
+    installed = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.add(name.lower().replace("-", "_"))
+    return installed
+
+
+class _ThreadLocalStdout:
+    """stdout proxy that sends a thread's writes to its own buffer while capturing."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return buffer if buffer is not None else self.stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def run_captured(self, func):
+        """Call func, returning (result, captured output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
 
 class InstallationVerifier:
-    def __init__(self):
+    def __init__(self, fail_fast=False):
         self.project_root = Path.cwd()
+        self.fail_fast = fail_fast
         self.models_dir = self.project_root / "models"
         self.config_dir = self.project_root / "config"
         self.scripts_dir = self.project_root / "scripts"
         self.logs_dir = self.project_root / "logs"
+        self.config_files = {
+            "Aider Configuration": self.config_dir / "aider_config.yml",
+            "Default Configuration": self.config_dir / "default.yaml",
+        }
 
         # Model detection results (set by verify_model_files)
         self.detected_model_file = None
         self.detected_model_name = None
         self.detected_expected_size = None
 
+        # Simple AI Assistant script location (shared by the assistant and functionality checks)
+        self.assistant_file = self._detect_assistant_file()
+
+        # Git probe results (set by _probe_git)
+        self._git_info = None
+
+        # On-disk cache of expensive check results (only kept when logs/ exists)
+        self.cache_file = self.logs_dir / ".verify_cache.json"
+        self._cache = None
+        self._cache_lock = threading.Lock()
+
+    def _detect_assistant_file(self):
+        """Locate the Simple AI Assistant script (historical or archived location)."""
+        candidates = [
+            self.project_root / "simple_ai_assistant.py",
+            self.project_root / "archive" / "simple_ai_assistant.py",
+        ]
+        return next((p for p in candidates if _isfile(p)), None)
+
+    def _run(self, cmd, timeout=5):
+        """Run a command capturing text output; return None if it timed out or could not start."""
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+
+    def _cache_get(self, key):
+        """Return a cached check result, or None on a miss."""
+        with self._cache_lock:
+            if self._cache is None:
+                try:
+                    self._cache = json.loads(self.cache_file.read_bytes())
+                except (OSError, ValueError):
+                    self._cache = {}
+            return self._cache.get(key)
+
+    def _cache_put(self, key, value):
+        """Store a check result and persist the cache if the logs directory exists."""
+        with self._cache_lock:
+            if self._cache is None:
+                self._cache = {}
+            self._cache[key] = value
+            if self.logs_dir.is_dir():
+                try:
+                    self.cache_file.write_text(json.dumps(self._cache, indent=2), encoding="utf-8")
+                except OSError:
+                    pass
+
     def print_header(self):
         """Print verification header."""
         print("🔍 Offline Coding Agent - Installation Verification")
@@ -49,40 +186,37 @@ class InstallationVerifier:
         else:
             print(f"✅ Python version: {sys.version.split()[0]}")
 
-        # Required packages
-        required_packages = {
-            "llama_cpp": "llama-cpp-python",
-            "rich": "rich",
-            "click": "click",
-            "yaml": "pyyaml",
-            "requests": "requests",
-            "tqdm": "tqdm"
-        }
+        failed_required = []
 
-        # Optional packages
-        optional_packages = {
-            "psutil": "psutil",
-            "git": "gitpython",
-            "watchdog": "watchdog",
-            "colorama": "colorama"
-        }
+        # One metadata scan answers most lookups; find_spec remains the fallback
+        # for modules whose distribution name differs (e.g. namespace packages)
+        installed = _installed_distributions()
 
-        failed_required = []
+        def is_installed(module, package):
+            # Modules this script already imported (e.g. psutil) need no probing
+            if module in sys.modules or module in installed or package.lower().replace("-", "_") in installed:
+                return True
+            return _cached_find_spec(module) is not None
 
         # Check required packages
-        for module, package in required_packages.items():
-            spec = importlib.util.find_spec(module)
-            if spec is not None:
+        for module, package in _REQUIRED_PACKAGES:
+            if is_installed(module, package):
                 print(f"✅ {package}")
             else:
                 print(f"❌ {package} - MISSING")
                 failed_required.append(package)
+                if self.fail_fast:
+                    break
+
+        # Check optional packages (skipped once fail-fast has seen a missing package)
+        if failed_required and self.fail_fast:
+            print(f"\n❌ Missing required package: {failed_required[0]}")
+            print("Run: python scripts/install_aider.py")
+            return False
 
-        # Check optional packages
         print("\n📚 Optional packages:")
-        for module, package in optional_packages.items():
-            spec = importlib.util.find_spec(module)
-            if spec is not None:
+        for module, package in _OPTIONAL_PACKAGES:
+            if is_installed(module, package):
                 print(f"✅ {package}")
             else:
                 print(f"⚠️  {package} - not installed (optional)")
@@ -100,47 +234,36 @@ class InstallationVerifier:
         print("\n🤖 Simple AI Assistant Verification")
         print("-" * 40)
 
-        # Check if the script exists (support both historical and archived locations)
-        candidates = [
-            self.project_root / "simple_ai_assistant.py",
-            self.project_root / "archive" / "simple_ai_assistant.py",
-        ]
-        assistant_file = next((p for p in candidates if p.exists()), None)
+        assistant_file = self.assistant_file
         if not assistant_file:
             print("❌ Simple AI Assistant script not found")
             return False
 
         print("✅ Simple AI Assistant script exists")
 
-        try:
-            # Test simple_ai_assistant help command
-            result = subprocess.run(
-                [sys.executable, str(assistant_file), "--help"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                print("✅ Simple AI Assistant help command works")
-            else:
-                print("⚠️  Simple AI Assistant help command failed")
-                print(f"Error: {result.stderr}")
-
-        except subprocess.TimeoutExpired:
-            print("⚠️  Simple AI Assistant help command timed out")
-        except Exception as e:
-            print(f"⚠️  Simple AI Assistant help command error: {e}")
+        # Test simple_ai_assistant help command; a passing result is cached for the
+        # current (interpreter, script, mtime) so unchanged installs skip the spawn.
+        # One entry is kept and overwritten, so the cache file does not grow.
+        script_stat = assistant_file.stat()
+        signature = f"{sys.executable}:{assistant_file}:{script_stat.st_mtime_ns}:{script_stat.st_size}"
+        if self._cache_get("assistant_help") == signature:
+            print("✅ Simple AI Assistant help command works (cached)")
+            return True
+
+        result = self._run([sys.executable, str(assistant_file), "--help"], timeout=10)
+        if result is None:
+            print("⚠️  Simple AI Assistant help command timed out or could not run")
+        elif result.returncode == 0:
+            print("✅ Simple AI Assistant help command works")
+            self._cache_put("assistant_help", signature)
+        else:
+            print("⚠️  Simple AI Assistant help command failed")
+            print(f"Error: {result.stderr}")
 
         return True
 
     def _detect_model_file(self):
         """Auto-detect model file with robust naming and size-based identification."""
-        # Find all .gguf files case-insensitively
-        ggufs = sorted(self.models_dir.glob("*.gguf"))
-        if not ggufs:
-            return None, None, None
-
         model_file = None
         model_name = None
         expected_size = None
@@ -148,31 +271,38 @@ class InstallationVerifier:
         # Prefer 7B models if multiple are present (they're smaller and more common)
         seven_b_candidates = []
         eight_b_candidates = []
+        fallback = None
 
-        for gguf_file in ggufs:
+        # Iterate lazily; only the (small) candidate buckets need a stable order
+        for gguf_file in self.models_dir.glob("*.gguf"):
             name_lower = gguf_file.name.lower()
-            file_size = gguf_file.stat().st_size
 
             # Check if it's a Qwen Coder model (case-insensitive)
             if "qwen" in name_lower and "coder" in name_lower:
                 if "7b" in name_lower:
-                    seven_b_candidates.append((gguf_file, file_size))
+                    seven_b_candidates.append(gguf_file)
                 elif "8b" in name_lower:
-                    eight_b_candidates.append((gguf_file, file_size))
+                    eight_b_candidates.append(gguf_file)
+
+            if fallback is None or gguf_file.name < fallback.name:
+                fallback = gguf_file
+
+        if fallback is None:
+            return None, None, None
 
         # Prefer 7B model if found (they're more common in restricted environments)
         if seven_b_candidates:
-            model_file = seven_b_candidates[0][0]
+            model_file = min(seven_b_candidates)
             model_name = model_file.stem
             expected_size = 4_700_000_000  # ~4.7GB for 7B models (tolerate quantization variance)
         elif eight_b_candidates:
             # Since we only support 7B models in this repository, treat 8B files as 7B
-            model_file = eight_b_candidates[0][0]
+            model_file = min(eight_b_candidates)
             model_name = model_file.stem
             expected_size = model_file.stat().st_size  # let tolerance guard handle quantization
         else:
             # Fallback to any GGUF file if no clear Qwen Coder match
-            model_file = ggufs[0]
+            model_file = fallback
             model_name = model_file.stem
             expected_size = model_file.stat().st_size  # Use actual size, let tolerance check pass
 
@@ -198,31 +328,42 @@ class InstallationVerifier:
                 print(f"  - {file.name}")
             return False
 
-        # Check file size
-        file_size = model_file.stat().st_size
+        # Check file size (stat once; reuse the result for any further checks)
+        model_stat = model_file.stat()
+        file_size = model_stat.st_size
         size_tolerance = expected_size * 0.15  # 15% tolerance for different quantizations
 
         print(f"📁 Model file: {model_file.name}")
         print(f"📋 Model: {model_name}")
-        print(f"📊 File size: {file_size / (1024**3):.1f} GB")
+        print(f"📊 File size: {file_size / _GIB:.1f} GB")
 
         if abs(file_size - expected_size) > size_tolerance:
             print("⚠️  File size outside expected range - may be different quantization")
         else:
             print("✅ Model file size correct")
 
+        # Check the GGUF header (magic + little-endian format version)
+        try:
+            with model_file.open("rb") as f:
+                header = f.read(8)
+        except OSError as e:
+            print(f"❌ Could not read model file: {e}")
+            return False
+
+        if len(header) < 8 or header[:4] != _GGUF_MAGIC:
+            print("❌ Model file is not a valid GGUF file (bad header)")
+            return False
+        print(f"✅ GGUF header valid (format version {int.from_bytes(header[4:8], 'little')})")
+
         # Check metadata file (optional)
-        metadata_file = model_file.with_suffix('.json')
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                print("✅ Model metadata file exists")
-                print(f"📋 Info: {metadata.get('description', 'No description')}")
-            except Exception as e:
-                print(f"⚠️  Could not read metadata file: {e}")
-        else:
+        try:
+            metadata = json.loads(model_file.with_suffix('.json').read_bytes())
+            print("✅ Model metadata file exists")
+            print(f"📋 Info: {metadata.get('description', 'No description')}")
+        except FileNotFoundError:
             print("ℹ️  Model metadata file not found (optional)")
+        except Exception as e:
+            print(f"⚠️  Could not read metadata file: {e}")
 
         return True
 
@@ -231,21 +372,31 @@ class InstallationVerifier:
         print("\n⚙️  Configuration Files Verification")
         print("-" * 40)
 
-        config_files = {
-            "Aider Configuration": self.config_dir / "aider_config.yml",
-            "Default Configuration": self.config_dir / "default.yaml",
-        }
+        config_files = self.config_files
+
+        # Imported here so a missing pyyaml is reported by verify_python_environment
+        # instead of aborting the whole script at import time
+        try:
+            import yaml
+        except ImportError:
+            yaml = None
+            print("⚠️  pyyaml not installed - skipping YAML syntax checks")
+        else:
+            # Prefer the libyaml-backed loader when pyyaml was built with it
+            yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
         all_exist = True
         for name, config_file in config_files.items():
-            if config_file.exists():
+            if _isfile(config_file):
                 print(f"✅ {name}: {config_file.name}")
 
                 # Try to parse YAML files
-                if config_file.suffix in ['.yml', '.yaml']:
+                if yaml is not None and config_file.suffix in ['.yml', '.yaml']:
                     try:
-                        with open(config_file, 'r') as f:
-                            yaml.safe_load(f)
+                        # Syntax check only: drain the parser's event stream
+                        # without constructing Python objects
+                        for _ in yaml.parse(config_file.read_bytes(), Loader=yaml_loader):
+                            pass
                         print(f"   Valid YAML syntax")
                     except yaml.YAMLError as e:
                         print(f"   ❌ YAML syntax error: {e}")
@@ -256,97 +407,96 @@ class InstallationVerifier:
 
         return all_exist
 
+    def _top_level_dirs(self):
+        """Names of directories directly under the project root, from one scandir pass."""
+        try:
+            with os.scandir(self.project_root) as entries:
+                # DirEntry.is_dir uses the readdir type info; only symlinks need a stat
+                return {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            return set()
+
     def verify_project_structure(self):
         """Verify project directory structure."""
         print("\n📁 Project Structure Verification")
         print("-" * 40)
 
         required_directories = [
-            self.models_dir,
-            self.config_dir,
-            self.scripts_dir,
-            self.logs_dir,
+            self.models_dir.name,
+            self.config_dir.name,
+            self.scripts_dir.name,
+            self.logs_dir.name,
         ]
 
-        optional_directories = [
-            self.project_root / "docs",
-            self.project_root / "examples",
-            self.project_root / "src",
-        ]
+        optional_directories = ["docs", "examples", "src"]
 
-        for directory in required_directories:
-            if directory.exists():
-                print(f"✅ {directory.name}/")
+        present = self._top_level_dirs()
+
+        for name in required_directories:
+            if name in present:
+                print(f"✅ {name}/")
             else:
-                print(f"❌ {directory.name}/ - MISSING")
+                print(f"❌ {name}/ - MISSING")
                 return False
 
         print("\n📁 Optional directories:")
-        for directory in optional_directories:
-            if directory.exists():
-                print(f"✅ {directory.name}/")
+        for name in optional_directories:
+            if name in present:
+                print(f"✅ {name}/")
             else:
-                print(f"⚠️  {directory.name}/ - not present (optional)")
+                print(f"⚠️  {name}/ - not present (optional)")
 
         return True
 
+    def _probe_git(self):
+        """Return (version, in_repository, user_name) from a single shell spawn, cached."""
+        if self._git_info is not None:
+            return self._git_info
+
+        separator = "@@verify-git@@"
+        steps = [
+            "git --version",
+            "git rev-parse --is-inside-work-tree",
+            "git config --global user.name",
+        ]
+        if os.name == "nt":
+            cmd = ["cmd", "/c", f" & echo {separator} & ".join(steps)]
+        else:
+            cmd = ["sh", "-c", f"; echo {separator}; ".join(steps)]
+
+        result = self._run(cmd)
+        sections = result.stdout.split(separator) if result is not None else []
+        sections = [section.strip() for section in sections] + [""] * (3 - len(sections))
+
+        version = sections[0] if sections[0].startswith("git version") else None
+        self._git_info = (version, sections[1] == "true", sections[2])
+        return self._git_info
+
     def verify_git_environment(self):
         """Verify Git environment setup."""
         print("\n🔀 Git Environment Verification")
         print("-" * 40)
 
-        # Check if git is available
-        try:
-            result = subprocess.run(
-                ["git", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                print(f"✅ Git: {result.stdout.strip()}")
-            else:
-                print("⚠️  Git command failed")
-                return False
+        version, in_repository, user_name = self._probe_git()
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        # Check if git is available
+        if not version:
             print("⚠️  Git not found or not accessible")
             return False
+        print(f"✅ Git: {version}")
 
         # Check if we're in a git repository
-        try:
-            result = subprocess.run(
-                ["git", "status"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                print("✅ Git repository detected")
-            else:
-                print("ℹ️  Not in a Git repository (this is OK)")
-
-        except subprocess.TimeoutExpired:
-            print("⚠️  Git status check timed out")
+        if in_repository:
+            print("✅ Git repository detected")
+        else:
+            print("ℹ️  Not in a Git repository (this is OK)")
 
         # Check Git configuration
-        try:
-            result = subprocess.run(
-                ["git", "config", "--global", "user.name"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                print(f"✅ Git user configured: {result.stdout.strip()}")
-            else:
-                print("⚠️  Git user name not configured")
-                print("   Run: git config --global user.name \"Your Name\"")
-
-        except subprocess.TimeoutExpired:
-            print("⚠️  Git configuration check timed out")
+        if user_name:
+            print(f"✅ Git user configured: {user_name}")
+        else:
+            print("⚠️  Git user name not configured")
+            print("   Run: git config --global user.name \"Your Name\"")
 
         return True
 
@@ -356,36 +506,33 @@ class InstallationVerifier:
         print("-" * 40)
 
         # Check available memory
-        try:
-            import psutil
+        if PSUTIL_AVAILABLE:
             memory = psutil.virtual_memory()
-            print(f"🧠 Total RAM: {memory.total / (1024**3):.1f} GB")
-            print(f"🔄 Available RAM: {memory.available / (1024**3):.1f} GB")
+            print(f"🧠 Total RAM: {memory.total / _GIB:.1f} GB")
+            print(f"🔄 Available RAM: {memory.available / _GIB:.1f} GB")
 
-            if memory.total >= 32 * 1024**3:
+            total_gib = memory.total // _GIB
+            if total_gib >= 32:
                 print("✅ Excellent: 32GB+ RAM - optimal for performance")
-            elif memory.total >= 16 * 1024**3:
+            elif total_gib >= 16:
                 print("✅ Good: 16GB+ RAM - sufficient for good performance")
-            elif memory.total >= 8 * 1024**3:
+            elif total_gib >= 8:
                 print("⚠️  Minimum: 8GB+ RAM - performance may be limited")
             else:
                 print("❌ Insufficient RAM: less than 8GB - performance will be poor")
-
-        except ImportError:
+        else:
             print("ℹ️  Install psutil to check RAM: pip install --user psutil")
 
         # Check disk space
         try:
-            if hasattr(os, 'statvfs'):
-                stat = os.statvfs(self.project_root)
-                free_space = stat.f_bavail * stat.f_frsize
-                print(f"💾 Free disk space: {free_space / (1024**3):.1f} GB")
-
-                if free_space < 5 * 1024**3:  # Less than 5GB
-                    print("⚠️  Low disk space - less than 5GB free")
-                else:
-                    print("✅ Sufficient disk space")
-        except:
+            free_space = shutil.disk_usage(self.project_root).free
+            print(f"💾 Free disk space: {free_space / _GIB:.1f} GB")
+
+            if free_space < 5 * _GIB:  # Less than 5GB
+                print("⚠️  Low disk space - less than 5GB free")
+            else:
+                print("✅ Sufficient disk space")
+        except OSError:
             print("ℹ️  Cannot check disk space on this system")
 
         return True
@@ -395,58 +542,35 @@ class InstallationVerifier:
         print("\n🧪 Basic Functionality Test")
         print("-" * 40)
 
-        # Create a test file
-        test_file = self.project_root / "test_verification.py"
-        test_content = '''# Test file for Simple AI Assistant verification
-def hello_world():
-    """A simple function to test Simple AI Assistant."""
-    return "Hello, World!"
-
-if __name__ == "__main__":
-    print(hello_world())
-'''
-
+        # Check the project root is writable; the temporary file is removed on close
         try:
-            with open(test_file, 'w') as f:
-                f.write(test_content)
-            print(f"✅ Created test file: {test_file}")
-
-        except Exception as e:
-            print(f"❌ Failed to create test file: {e}")
+            with tempfile.NamedTemporaryFile(dir=self.project_root, prefix=".verify_", delete=True):
+                pass
+            print("✅ Project directory is writable")
+        except OSError as e:
+            print(f"❌ Cannot write to project directory: {e}")
             return False
 
-        # Test that we can import required modules (llama-cpp-python, rich)
-        try:
-            import llama_cpp
-            print("✅ Can import llama-cpp-python modules")
-        except ImportError as e:
-            print(f"❌ Cannot import llama-cpp-python modules: {e}")
+        # Locate required modules (llama-cpp-python, rich) without importing them;
+        # importing llama_cpp loads its shared library, which is slow and unnecessary here
+        llama_spec = _cached_find_spec("llama_cpp")
+        if llama_spec is None or (llama_spec.origin and not _isfile(llama_spec.origin)):
+            print("❌ Cannot locate llama-cpp-python modules")
             return False
+        print("✅ Can locate llama-cpp-python modules")
 
-        try:
-            import rich
-            print("✅ Can import rich modules")
-        except ImportError as e:
-            print(f"⚠️  Cannot import rich modules: {e}")
+        if _cached_find_spec("rich") is not None:
+            print("✅ Can locate rich modules")
+        else:
+            print("⚠️  Cannot locate rich modules")
 
-        # Test that Simple AI Assistant script exists (check both locations)
-        assistant_file = next((p for p in [
-            self.project_root / "simple_ai_assistant.py",
-            self.project_root / "archive" / "simple_ai_assistant.py",
-        ] if p.exists()), None)
-        if assistant_file:
+        # Test that Simple AI Assistant script exists
+        if self.assistant_file:
             print("✅ Simple AI Assistant script exists")
         else:
             print("❌ Simple AI Assistant script not found")
             return False
 
-        # Clean up test file
-        try:
-            test_file.unlink()
-            print("✅ Cleaned up test file")
-        except:
-            print("⚠️  Could not clean up test file")
-
         return True
 
     def generate_verification_report(self, results):
@@ -454,14 +578,16 @@ if __name__ == "__main__":
         print("\n📊 Verification Summary")
         print("=" * 60)
 
-        passed = sum(1 for success, _ in results.values() if success)
+        # Count and format in a single pass over the results
+        passed = 0
+        lines = []
+        for category, (success, message) in results.items():
+            passed += bool(success)
+            lines.append(f"{'✅' if success else '❌'} {category}")
         total = len(results)
 
         print(f"✅ Passed: {passed}/{total} verification categories")
-
-        for category, (success, message) in results.items():
-            status = "✅" if success else "❌"
-            print(f"{status} {category}")
+        print("\n".join(lines))
 
         if passed == total:
             print("\n🎉 All verifications passed!")
@@ -482,32 +608,107 @@ if __name__ == "__main__":
 
         return passed == total
 
-    def run_verification(self):
+    def _stamp_key(self):
+        """Digest of everything the verification outcome depends on."""
+        def stat_of(path):
+            try:
+                st = path.stat()
+                return [str(path), st.st_size, st.st_mtime_ns]
+            except OSError:
+                return [str(path), None]
+
+        inputs = [sys.version, sys.executable, sorted(_installed_distributions())]
+        inputs += [stat_of(p) for p in sorted(self.models_dir.glob("*"))]
+        inputs += [stat_of(p) for p in self.config_files.values()]
+        inputs.append(stat_of(self.assistant_file) if self.assistant_file else None)
+        inputs.append(sorted(self._top_level_dirs()))
+        # The git check only depends on a git executable being reachable
+        git = shutil.which("git")
+        inputs.append(stat_of(Path(git)) if git else None)
+        return hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()
+
+    def run_verification(self, use_cache=True):
         """Run all verification checks."""
-        self.print_header()
+        # Route output through per-thread buffers so each section is written once
+        stdout = _ThreadLocalStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            return self._run_verification(stdout, use_cache)
+        finally:
+            sys.stdout = stdout.stream
+            sys.stdout.flush()
+
+    def _emit(self, stdout, func):
+        """Call func with its output captured, then write that output in one call."""
+        result, output = stdout.run_captured(func)
+        stdout.stream.write(output)
+        return result
+
+    def _run_verification(self, stdout, use_cache):
+        self._emit(stdout, self.print_header)
+
+        # Skip every check if nothing changed since the last successful run. Only
+        # the latest stamp is kept (in .verify_cache.json), replacing the previous one.
+        stamp = None
+        if use_cache:
+            stamp = self._stamp_key()
+            if self._cache_get("verification_stamp") == stamp:
+                stdout.stream.write(
+                    "✅ Nothing changed since the last successful verification (cached OK)\n"
+                    "   Run with --no-cache to repeat all checks\n"
+                )
+                return True
 
         results = {}
 
-        # Run all verifications
-        results["Python Environment"] = self.verify_python_environment(), ""
-        results["Simple AI Assistant"] = self.verify_simple_ai_assistant(), ""
-        results["Model Files"] = self.verify_model_files(), ""
-        results["Configuration Files"] = self.verify_configuration_files(), ""
-        results["Project Structure"] = self.verify_project_structure(), ""
-        results["Git Environment"] = self.verify_git_environment(), ""
-        results["System Resources"] = self.verify_system_resources(), ""
-        results["Basic Functionality"] = self.test_basic_functionality(), ""
+        checks = [
+            ("Python Environment", self.verify_python_environment),
+            ("Simple AI Assistant", self.verify_simple_ai_assistant),
+            ("Model Files", self.verify_model_files),
+            ("Configuration Files", self.verify_configuration_files),
+            ("Project Structure", self.verify_project_structure),
+            ("Git Environment", self.verify_git_environment),
+            ("System Resources", self.verify_system_resources),
+            ("Basic Functionality", self.test_basic_functionality),
+        ]
+
+        # Run all verifications concurrently (they are independent and mostly wait
+        # on subprocesses); each check's output is captured and replayed in order.
+        # Fail-fast runs them one at a time so the rest can be cancelled.
+        workers = 1 if self.fail_fast else len(checks)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [(name, executor.submit(stdout.run_captured, check)) for name, check in checks]
+            for name, future in futures:
+                success, output = future.result()
+                stdout.stream.write(output)
+                results[name] = success, ""
+                if self.fail_fast and not success:
+                    for _, pending in futures:
+                        pending.cancel()
+                    break
 
         # Generate final report
-        success = self.generate_verification_report(results)
+        success = self._emit(stdout, lambda: self.generate_verification_report(results))
+
+        if success and stamp is not None:
+            self._cache_put("verification_stamp", stamp)
+            # Per-environment stamp files written by earlier versions; superseded
+            shutil.rmtree(self.logs_dir / "verify_cache", ignore_errors=True)
 
         return success
 
 def main():
     """Main verification function."""
+    parser = argparse.ArgumentParser(description="Verify the Offline Coding Agent installation")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore results cached from a previous successful run")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Stop at the first failed check")
+    args = parser.parse_args()
+
     try:
-        verifier = InstallationVerifier()
-        success = verifier.run_verification()
+        verifier = InstallationVerifier(fail_fast=args.fail_fast)
+        success = verifier.run_verification(use_cache=not args.no_cache)
 
         if not success:
             print("\n❌ Installation verification failed")
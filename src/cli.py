@@ -6,13 +6,16 @@ Main CLI entry point for Offline Coding Agent
 import click
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Tuple
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.config import config
-from utils.formatting import print_error, print_success, print_info, format_response
+from utils.config import Config, get_config
+from utils.formatting import print_error, print_warning, print_success, print_info, format_response
 
 
 @click.group()
@@ -23,50 +26,53 @@ def cli(ctx, config, verbose):
     """Offline Coding Agent - AI-powered coding assistant that operates completely offline."""
     ctx.ensure_object(dict)
 
-    # Load configuration
+    # Load configuration; the default file is only parsed once a command needs it
     try:
         if config:
-            from utils.config import Config
             ctx.obj['config'] = Config(config)
-        else:
-            ctx.obj['config'] = ctx.obj.get('config', ctx.obj['config'])
 
         ctx.obj['verbose'] = verbose
 
-        if verbose:
-            print_info(f"Using configuration: {ctx.obj['config'].config_file}")
-
     except Exception as e:
         print_error(f"Failed to load configuration: {e}")
         sys.exit(1)
 
+    if verbose:
+        print_info(f"Using configuration: {_get_config(ctx).config_file}")
+
+
+def _get_config(ctx) -> Config:
+    """Return this invocation's Config, loading the default configuration on first use."""
+    if 'config' not in ctx.obj:
+        try:
+            ctx.obj['config'] = get_config()
+        except Exception as e:
+            print_error(f"Failed to load configuration: {e}")
+            sys.exit(1)
+    return ctx.obj['config']
+
 
 @cli.command()
-@click.option('--file', '-f', required=True, help='File to analyze/generate code for')
+@click.option('--file', '-f', 'file_path', required=True, help='File to analyze/generate code for',
+              type=click.Path(exists=True, dir_okay=False, path_type=Path))
 @click.option('--language', '-l', help='Programming language')
 @click.option('--prompt', '-p', help='Additional prompt context')
 @click.option('--format', 'output_format', default='text', type=click.Choice(['text', 'json']))
 @click.pass_context
-def gen(ctx, file, language, prompt, output_format):
+def gen(ctx, file_path, language, prompt, output_format):
     """Generate code based on existing file or description."""
     try:
-        file_path = Path(file)
-
-        if not file_path.exists():
-            print_error(f"File not found: {file}")
-            return
-
         # Detect language if not specified
         if not language:
             language = _detect_language(file_path)
 
         if ctx.obj.get('verbose'):
-            print_info(f"Generating code for {file} (language: {language})")
+            print_info(f"Generating code for {file_path} (language: {language})")
 
         # TODO: Implement actual model inference
         # For now, return a placeholder response
         response = {
-            "content": f"""# Generated code for {file}
+            "content": f"""# Generated code for {file_path}
 
 ```{language}
 # This is a placeholder response
@@ -91,28 +97,23 @@ def example_function():
 
 
 @cli.command()
-@click.option('--file', '-f', required=True, help='File to explain')
+@click.option('--file', '-f', 'file_path', required=True, help='File to explain',
+              type=click.Path(exists=True, dir_okay=False, path_type=Path))
 @click.option('--format', 'output_format', default='text', type=click.Choice(['text', 'json']))
 @click.pass_context
-def explain(ctx, file, output_format):
+def explain(ctx, file_path, output_format):
     """Explain what a piece of code does."""
     try:
-        file_path = Path(file)
-
-        if not file_path.exists():
-            print_error(f"File not found: {file}")
-            return
-
         if ctx.obj.get('verbose'):
-            print_info(f"Explaining code in {file}")
+            print_info(f"Explaining code in {file_path}")
 
-        # Read file content
+        # Read only the preview (one extra character tells us whether to add '...')
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            content = f.read(201)
 
         # TODO: Implement actual model inference
         response = {
-            "content": f"""# Code Explanation for {file}
+            "content": f"""# Code Explanation for {file_path}
 
 This file contains code that would be analyzed and explained by the DeepSeek-Coder model.
 
@@ -145,20 +146,17 @@ def init(ctx, directory):
             print_info(f"Initializing workspace in {dir_path}")
 
         # Create necessary directories
-        ctx.obj['config'].ensure_directories()
+        _get_config(ctx).ensure_directories()
 
         # Scan directory for files
-        extensions = ctx.obj['config'].get('context.file_extensions', [])
-        files = []
-
-        for ext in extensions:
-            files.extend(dir_path.rglob(f"*{ext}"))
+        extensions = _get_config(ctx).get('context.file_extensions', [])
+        files = _scan_files(str(dir_path), extensions)
 
         print_success(f"Workspace initialized. Found {len(files)} relevant files.")
 
         if ctx.obj.get('verbose'):
             for file in files[:10]:  # Show first 10 files
-                print(f"  - {file.relative_to(dir_path)}")
+                print(f"  - {os.path.relpath(file, dir_path)}")
             if len(files) > 10:
                 print(f"  ... and {len(files) - 10} more files")
 
@@ -171,7 +169,7 @@ def init(ctx, directory):
 def status(ctx):
     """Show current status and configuration."""
     try:
-        config_obj = ctx.obj['config']
+        config_obj = _get_config(ctx)
 
         print_info("Offline Coding Agent Status")
         print(f"Model: {config_obj.get('model.name')}")
@@ -180,12 +178,11 @@ def status(ctx):
         print(f"Cache Directory: {config_obj.get_cache_directory()}")
 
         # Check if model exists
-        model_path = config_obj.get_model_path()
-        if os.path.exists(model_path):
-            model_size = os.path.getsize(model_path) / (1024 * 1024 * 1024)  # GB
-            print_success(f"Model found: {model_size:.1f} GB")
+        model_size = config_obj.model_size()
+        if model_size is not None:
+            print_success(f"Model found: {model_size / (1 << 30):.1f} GB")
         else:
-            print_warning(f"Model not found at {model_path}")
+            print_warning(f"Model not found at {config_obj.get_model_path()}")
 
         # Check configuration validity
         if config_obj.validate():
@@ -197,52 +194,101 @@ def status(ctx):
         print_error(f"Status check failed: {e}")
 
 
-def _detect_language(file_path: Path) -> str:
-    """Detect programming language from file extension."""
-    extension_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'jsx',
-        '.tsx': 'tsx',
-        '.java': 'java',
-        '.cpp': 'cpp',
-        '.c': 'c',
-        '.h': 'c',
-        '.cs': 'csharp',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.php': 'php',
-        '.rb': 'ruby',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.r': 'r',
-        '.sql': 'sql',
-        '.sh': 'bash',
-        '.bat': 'batch',
-        '.ps1': 'powershell',
-        '.html': 'html',
-        '.css': 'css',
-        '.scss': 'scss',
-        '.less': 'less',
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.xml': 'xml',
-        '.toml': 'toml',
-        '.ini': 'ini',
-        '.md': 'markdown',
-    }
-
-    suffix = file_path.suffix.lower()
-    return extension_map.get(suffix, 'text')
+def _scan_dir(path: str, suffixes: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
+    """List one directory: (matching files, subdirectories to descend into)."""
+    files, subdirs = [], []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return files, subdirs  # unreadable directory; rglob skipped these too
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif os.path.normcase(entry.name).endswith(suffixes):
+                files.append(entry.path)
+    return files, subdirs
+
+
+def _scan_files(root: str, extensions) -> List[str]:
+    """Return sorted paths of files under root whose names end with one of extensions.
+
+    Walks the tree once with os.scandir (symlinked directories are not followed),
+    instead of one rglob pass per extension. Directories are listed on a thread
+    pool so enumeration latency on network drives overlaps.
+    """
+    suffixes = tuple(os.path.normcase(ext) for ext in extensions)
+    if not suffixes:
+        return []
+
+    files = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        pending = {executor.submit(_scan_dir, root, suffixes)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, subdirs = future.result()
+                files.extend(found)
+                pending.update(executor.submit(_scan_dir, subdir, suffixes) for subdir in subdirs)
+
+    # Completion order varies between runs; keep the listing stable
+    files.sort()
+    return files
+
+
+# File extension -> language name, built once at import
+_EXTENSION_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'jsx',
+    '.tsx': 'tsx',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.r': 'r',
+    '.sql': 'sql',
+    '.sh': 'bash',
+    '.bat': 'batch',
+    '.ps1': 'powershell',
+    '.html': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.less': 'less',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.xml': 'xml',
+    '.toml': 'toml',
+    '.ini': 'ini',
+    '.md': 'markdown',
+}
+
+
+def _detect_language(file_path) -> str:
+    """Detect programming language from file extension (str or Path)."""
+    return _language_for_suffix(os.path.splitext(file_path)[1])
+
+
+@lru_cache(maxsize=64)
+def _language_for_suffix(suffix: str) -> str:
+    """Map a raw suffix to a language; keyed on the short suffix string, not the path."""
+    return _EXTENSION_MAP.get(suffix.lower(), 'text')
 
 
 def main():
     """Main entry point."""
-    # Initialize config with default instance
-    cli(obj={'config': config})
+    # Config is loaded lazily by the commands that use it
+    cli(obj={})
 
 
 if __name__ == '__main__':
@@ -2,7 +2,14 @@
 Utility modules for Offline Coding Agent
 """
 
-from .config import Config, config
+from .config import Config, get_config
 from .formatting import format_output, colorize_text
 
+
+def __getattr__(name):
+    # Forward the lazily-created default config without loading it at import
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = ["Config", "config", "format_output", "colorize_text"]
\ No newline at end of file
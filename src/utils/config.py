@@ -2,11 +2,36 @@
 Configuration management for Offline Coding Agent
 """
 
+import copy
 import os
 import yaml
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
+try:
+    # libyaml-backed loader: same safe semantics as safe_load, much faster parsing
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# Parsed configuration files: absolute path -> (mtime_ns, size, config), LRU order
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+# Marks Config._model_size as not yet looked up
+_MISSING = object()
+
+
+def _flatten(data: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield (dotted key, value) for every node below a mapping, nested dicts included."""
+    if isinstance(data, dict):
+        for k, v in data.items():
+            dotted = f"{prefix}{k}"
+            yield dotted, v
+            yield from _flatten(v, dotted + ".")
+
 
 class Config:
     """Configuration manager for the offline coding agent."""
@@ -20,6 +45,9 @@ class Config:
         """
         self.config_file = config_file or self._get_default_config_path()
         self.config = self._load_config()
+        # Every dotted key resolved up front, so get() is a single dict lookup
+        self._flat: Dict[str, Any] = dict(_flatten(self.config))
+        self._model_size: Any = _MISSING  # see model_size()
 
     def _get_default_config_path(self) -> str:
         """Get default configuration file path."""
@@ -28,10 +56,26 @@ class Config:
         return str(package_dir / "config" / "default.yaml")
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        Parsed files are cached by path and revalidated by mtime and size; each
+        caller gets its own deep copy so set() never leaks between instances.
+        """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            key = os.path.abspath(self.config_file)
+            st = os.stat(key)
+            entry = _YAML_CACHE.get(key)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                _YAML_CACHE.move_to_end(key)
+                return copy.deepcopy(entry[2])
+
+            with open(key, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=_Loader)
+
+            _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+            return copy.deepcopy(data)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         except yaml.YAMLError as e:
@@ -48,16 +92,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -67,22 +102,44 @@ class Config:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
+        self._model_size = _MISSING
         keys = key.split('.')
         config = self.config
 
-        for k in keys[:-1]:
+        for i, k in enumerate(keys[:-1]):
             if k not in config:
                 config[k] = {}
+                self._flat['.'.join(keys[:i + 1])] = config[k]
             config = config[k]
 
         config[keys[-1]] = value
 
+        # Re-flatten the replaced subtree; ancestors hold the same dict objects
+        prefix = key + '.'
+        for stale in [k for k in self._flat if k.startswith(prefix)]:
+            del self._flat[stale]
+        self._flat[key] = value
+        self._flat.update(_flatten(value, prefix))
+
     def get_model_path(self) -> str:
         """Get full path to model file."""
         model_dir = Path(self.get('model.path', './models'))
         model_name = self.get('model.name', 'deepseek-coder-1.3b.Q4_K_M.gguf')
         return str(model_dir / model_name)
 
+    def model_size(self) -> Optional[int]:
+        """Size of the model file in bytes, or None if it does not exist.
+
+        Stat'ed once per instance (the model is several GB, often on slow storage)
+        and shared by status reporting and validate().
+        """
+        if self._model_size is _MISSING:
+            try:
+                self._model_size = os.stat(self.get_model_path()).st_size
+            except OSError:
+                self._model_size = None
+        return self._model_size
+
     def get_cache_directory(self) -> str:
         """Get cache directory path."""
         cache_dir = self.get('context.cache_directory', './cache')
@@ -114,9 +171,8 @@ class Config:
                     raise ValueError(f"Required configuration field missing: {field}")
 
             # Validate model path exists
-            model_path = self.get_model_path()
-            if not os.path.exists(model_path):
-                print(f"Warning: Model file not found at {model_path}")
+            if self.model_size() is None:
+                print(f"Warning: Model file not found at {self.get_model_path()}")
                 return False
 
             return True
@@ -126,5 +182,20 @@ class Config:
             return False
 
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+# Global configuration instance, loaded on first access (see get_config)
+_default_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Return the shared default configuration, parsing it on first use."""
+    global _default_config
+    if _default_config is None:
+        _default_config = Config()
+    return _default_config
+
+
+def __getattr__(name: str) -> Any:
+    # `config` is created lazily so importing this module never parses YAML
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,15 +2,36 @@
 Output formatting utilities for Offline Coding Agent
 """
 
-import json
-from typing import Dict, Any, Optional
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.panel import Panel
-from rich.text import Text
+import re
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+    from rich.text import Text
 
-console = Console()
+# Rich is imported and the Console built on first output, not at import time,
+# so commands that print little (or only --help) start faster
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Return the shared Console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `formatting.console` working for existing importers
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Fenced code block: info-string line, then body up to the closing fence (or end of
+# text for an unterminated block). A fence with no newline is treated as bare code.
+_FENCE_RE = re.compile(r"```([^\n]*?)(?:\n(.*?))?(?:```|\Z)", re.DOTALL)
 
 
 def format_output(
@@ -28,30 +49,42 @@ def format_output(
         language: Programming language (for code highlighting)
         title: Optional title for panels
     """
+    _get_console().print(_render_output(content, format_type, language, title))
+
+
+def _render_output(
+    content: str,
+    format_type: str = "text",
+    language: Optional[str] = None,
+    title: Optional[str] = None
+) -> "RenderableType":
+    """Build the renderable that format_output prints, without printing it."""
     if format_type == "json":
+        import json
         try:
             # Try to parse and pretty-print JSON
             json_data = json.loads(content)
-            console.print(json.dumps(json_data, indent=2))
+            return json.dumps(json_data, indent=2)
         except json.JSONDecodeError:
             # If not valid JSON, print as text
-            console.print(content)
+            return content
     elif format_type == "code" and language:
         # Display with syntax highlighting
+        from rich.panel import Panel
+        from rich.syntax import Syntax
         syntax = Syntax(content, language, theme="monokai", line_numbers=True)
         if title:
-            console.print(Panel(syntax, title=title, border_style="blue"))
-        else:
-            console.print(syntax)
+            return Panel(syntax, title=title, border_style="blue")
+        return syntax
     else:
         # Display as plain text
         if title:
-            console.print(Panel(content, title=title, border_style="green"))
-        else:
-            console.print(content)
+            from rich.panel import Panel
+            return Panel(content, title=title, border_style="green")
+        return content
 
 
-def colorize_text(text: str, color: str = "white") -> Text:
+def colorize_text(text: str, color: str = "white") -> "Text":
     """
     Apply color formatting to text.
 
@@ -62,27 +95,28 @@ def colorize_text(text: str, color: str = "white") -> Text:
     Returns:
         Rich Text object with color applied
     """
+    from rich.text import Text
     return Text(text, style=color)
 
 
 def print_error(message: str) -> None:
     """Print error message in red."""
-    console.print(f"[red]Error: {message}[/red]")
+    _get_console().print(f"[red]Error: {message}[/red]")
 
 
 def print_warning(message: str) -> None:
     """Print warning message in yellow."""
-    console.print(f"[yellow]Warning: {message}[/yellow]")
+    _get_console().print(f"[yellow]Warning: {message}[/yellow]")
 
 
 def print_success(message: str) -> None:
     """Print success message in green."""
-    console.print(f"[green]Success: {message}[/green]")
+    _get_console().print(f"[green]Success: {message}[/green]")
 
 
 def print_info(message: str) -> None:
     """Print info message in blue."""
-    console.print(f"[blue]Info: {message}[/blue]")
+    _get_console().print(f"[blue]Info: {message}[/blue]")
 
 
 def format_response(response: Dict[str, Any], format_type: str = "text") -> None:
@@ -93,7 +127,9 @@ def format_response(response: Dict[str, Any], format_type: str = "text") -> None
         response: Response dictionary from model
         format_type: Output format (text, json)
     """
+    console = _get_console()
     if format_type == "json":
+        import json
         console.print(json.dumps(response, indent=2))
     else:
         # Extract content from response
@@ -102,22 +138,29 @@ def format_response(response: Dict[str, Any], format_type: str = "text") -> None
 
             # Check if response contains code
             if "```" in content:
-                # Extract code blocks and format them
-                parts = content.split("```")
-                for i, part in enumerate(parts):
-                    if i % 2 == 0:
-                        # Regular text
-                        if part.strip():
-                            console.print(part.strip())
+                # Extract code blocks and format them in a single scan, then
+                # print everything in one console write
+                renderables = []
+                pos = 0
+                for match in _FENCE_RE.finditer(content):
+                    # Regular text before the block
+                    text = content[pos:match.start()].strip()
+                    if text:
+                        renderables.append(text)
+
+                    # Code block - language from the info string
+                    language, code = match.group(1), match.group(2)
+                    if code is None:
+                        renderables.append(_render_output(language.strip(), "code", "text"))
                     else:
-                        # Code block - extract language and content
-                        lines = part.split("\n", 1)
-                        if len(lines) == 2:
-                            language = lines[0].strip()
-                            code = lines[1].strip()
-                            format_output(code, "code", language)
-                        else:
-                            format_output(part.strip(), "code", "text")
+                        renderables.append(_render_output(code.strip(), "code", language.strip()))
+                    pos = match.end()
+
+                text = content[pos:].strip()
+                if text:
+                    renderables.append(text)
+                from rich.console import Group
+                console.print(Group(*renderables))
             else:
                 # Regular text response
                 console.print(content)
@@ -1,7 +0,0 @@
-# Test file for Simple AI Assistant verification
-def hello_world():
-    """A simple function to test Simple AI Assistant."""
-    return "Hello, World!"
-
-if __name__ == "__main__":
-    print(hello_world())
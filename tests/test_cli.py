@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+try:
+    import cli
+except ImportError:  # click is not installed
+    cli = None
+
+
+@unittest.skipIf(cli is None, "click is not installed")
+class TestScanFiles(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for rel in ("main.py", "README.md", "pkg/util.py", "pkg/deep/er/x.js",
+                    "pkg/deep/notes.txt", "empty/.keep"):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+
+    def scan(self, extensions):
+        return [os.path.relpath(p, self.root).replace(os.sep, "/")
+                for p in cli._scan_files(str(self.root), extensions)]
+
+    def test_walks_the_whole_tree_sorted(self):
+        self.assertEqual(self.scan([".py", ".js"]), ["main.py", "pkg/deep/er/x.js", "pkg/util.py"])
+
+    def test_no_extensions_or_no_matches(self):
+        self.assertEqual(self.scan([]), [])
+        self.assertEqual(self.scan([".rs"]), [])
+
+    def test_missing_root_is_empty(self):
+        self.assertEqual(cli._scan_files(str(self.root / "nope"), [".py"]), [])
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "no symlink support")
+    def test_symlinked_directories_are_not_followed(self):
+        try:
+            os.symlink(self.root / "pkg", self.root / "link", target_is_directory=True)
+        except OSError:
+            self.skipTest("cannot create symlinks here")
+        self.assertEqual(self.scan([".py"]), ["main.py", "pkg/util.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
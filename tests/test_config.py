@@ -0,0 +1,80 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.config import Config, _flatten  # noqa: E402
+
+
+class TestFlatten(unittest.TestCase):
+    def test_every_node_gets_a_dotted_key(self):
+        data = {"model": {"name": "m.gguf", "opts": {"n_ctx": 4096}}, "debug": False}
+        self.assertEqual(dict(_flatten(data)), {
+            "model": data["model"],
+            "model.name": "m.gguf",
+            "model.opts": {"n_ctx": 4096},
+            "model.opts.n_ctx": 4096,
+            "debug": False,
+        })
+
+    def test_non_mapping_yields_nothing(self):
+        self.assertEqual(list(_flatten([1, 2])), [])
+        self.assertEqual(list(_flatten(None)), [])
+
+
+class TestConfigIndex(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name) / "config.yaml"
+        path.write_text(
+            "model:\n"
+            "  name: m.gguf\n"
+            "  opts:\n"
+            "    n_ctx: 4096\n"
+            "    n_batch: 512\n"
+            "cli:\n"
+            "  output_format: text\n",
+            encoding="utf-8"
+        )
+        self.path = str(path)
+        self.config = Config(self.path)
+
+    def test_get_reads_nested_and_missing_keys(self):
+        self.assertEqual(self.config.get("model.opts.n_ctx"), 4096)
+        self.assertEqual(self.config.get("model.opts"), {"n_ctx": 4096, "n_batch": 512})
+        self.assertEqual(self.config.get("model.missing", "fallback"), "fallback")
+
+    def test_set_leaf_updates_ancestors(self):
+        self.config.set("model.opts.n_ctx", 8192)
+        self.assertEqual(self.config.get("model.opts.n_ctx"), 8192)
+        self.assertEqual(self.config.get("model.opts")["n_ctx"], 8192)
+        self.assertEqual(self.config.get("model")["opts"]["n_ctx"], 8192)
+
+    def test_set_subtree_drops_stale_keys(self):
+        self.config.set("model.opts", {"threads": 4})
+        self.assertIsNone(self.config.get("model.opts.n_ctx"))
+        self.assertIsNone(self.config.get("model.opts.n_batch"))
+        self.assertEqual(self.config.get("model.opts.threads"), 4)
+
+    def test_set_creates_missing_parents(self):
+        self.config.set("context.cache.size", 10)
+        self.assertEqual(self.config.get("context"), {"cache": {"size": 10}})
+        self.assertEqual(self.config.get("context.cache"), {"size": 10})
+        self.assertEqual(self.config.get("context.cache.size"), 10)
+
+    def test_index_matches_a_fresh_flatten_after_sets(self):
+        self.config.set("model.opts", {"threads": 4})
+        self.config.set("model.name", "other.gguf")
+        self.config.set("new.key", [1, 2])
+        self.assertEqual(self.config._flat, dict(_flatten(self.config.config)))
+
+    def test_set_does_not_leak_into_other_instances(self):
+        self.config.set("model.opts.n_ctx", 1)
+        self.assertEqual(Config(self.path).get("model.opts.n_ctx"), 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import stat
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "archive"))
+
+import smart_assistant  # noqa: E402
+from smart_assistant import SmartAIAssistant, SmartToolManager  # noqa: E402
+
+
+class SmartToolManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name).resolve()
+        self.tools = SmartToolManager()
+        self.tools.working_directory = self.tmp
+        # The file tools call _is_path_safe, which only SmartAIAssistant defines;
+        # borrow that implementation so the tools can run
+        self.tools._is_path_safe = types.MethodType(SmartAIAssistant._is_path_safe, self.tools)
+
+
+class TestReadCache(SmartToolManagerTestCase):
+    def test_unchanged_file_is_served_from_cache(self):
+        path = self.tmp / "a.txt"
+        path.write_text("one\n")
+        first = self.tools.tool_read_file(str(path))
+        first["content"] = "mutated by caller"
+        self.assertEqual(self.tools.tool_read_file(str(path))["content"], "one\n")
+        self.assertEqual(len(self.tools._read_cache), 1)
+
+    def test_external_change_is_picked_up(self):
+        path = self.tmp / "a.txt"
+        path.write_text("one\n")
+        self.tools.tool_read_file(str(path))
+        path.write_text("three\n")
+        self.assertEqual(self.tools.tool_read_file(str(path))["content"], "three\n")
+
+    def test_write_invalidates_the_entry(self):
+        path = self.tmp / "a.txt"
+        path.write_text("one\n")
+        self.tools.tool_read_file(str(path))
+        self.assertTrue(self.tools.tool_write_file(str(path), "two\n")["success"])
+        self.assertEqual(self.tools.tool_read_file(str(path))["content"], "two\n")
+
+    def test_cache_is_bounded(self):
+        for i in range(smart_assistant._READ_CACHE_SIZE + 5):
+            path = self.tmp / f"f{i}.txt"
+            path.write_text(str(i))
+            self.tools.tool_read_file(str(path))
+        self.assertEqual(len(self.tools._read_cache), smart_assistant._READ_CACHE_SIZE)
+        self.assertNotIn(str(self.tmp / "f0.txt"), self.tools._read_cache)
+
+
+class TestAtomicWrite(SmartToolManagerTestCase):
+    def test_creates_parents_and_leaves_no_temp_file(self):
+        path = self.tmp / "new" / "file.txt"
+        self.assertTrue(self.tools.tool_write_file(str(path), "hello\n")["success"])
+        self.assertEqual(path.read_text(), "hello\n")
+        self.assertEqual(os.listdir(path.parent), ["file.txt"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_replacing_a_file_keeps_its_mode(self):
+        path = self.tmp / "run.sh"
+        path.write_text("echo old\n")
+        path.chmod(0o750)
+        self.tools.tool_write_file(str(path), "echo new\n")
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o750)
+        self.assertEqual(path.read_text(), "echo new\n")
+
+    def test_write_through_symlink_keeps_the_link(self):
+        target = self.tmp / "real.txt"
+        target.write_text("old")
+        link = self.tmp / "link.txt"
+        try:
+            os.symlink(target, link)
+        except (OSError, NotImplementedError):
+            self.skipTest("cannot create symlinks here")
+        self.tools.tool_write_file(str(link), "new")
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(target.read_text(), "new")
+
+    def test_failed_replace_removes_the_temp_file(self):
+        (self.tmp / "dir").mkdir()
+        result = self.tools.tool_write_file(str(self.tmp / "dir"), "x")
+        self.assertFalse(result["success"])
+        self.assertEqual(sorted(os.listdir(self.tmp)), ["dir"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,284 @@
+import contextlib
+import io
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from working_assistant import (  # noqa: E402
+    WorkingAIAssistant,
+    WorkingToolManager,
+    _PythonWorkerPool,
+    _parse_tool_args,
+    _should_unescape_model_output,
+)
+
+
+class TestParseToolArgs(unittest.TestCase):
+    def test_escapes_in_triple_quoted_content_stay_literal(self):
+        args = _parse_tool_args(
+            "file_path='join.py', content=\"\"\"import os\nprint('\\n'.join(x))\"\"\""
+        )
+        self.assertEqual(args["file_path"], "join.py")
+        self.assertEqual(args["content"], "import os\nprint('\\n'.join(x))")
+        self.assertFalse(_should_unescape_model_output(args["content"]))
+        compile(args["content"], "join.py", "exec")
+
+    def test_escapes_in_single_quoted_value_stay_literal(self):
+        args = _parse_tool_args("file_path='a.txt', content='one\\ntwo'")
+        self.assertEqual(args["content"], "one\\ntwo")
+
+    def test_non_string_values_are_evaluated(self):
+        args = _parse_tool_args("command='ls', timeout=5, binary=True")
+        self.assertEqual(args, {"command": "ls", "timeout": 5, "binary": True})
+
+
+class TestPythonWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = _PythonWorkerPool(1, Path.cwd())
+        self.spawned = []
+        spawn = self.pool._spawn
+
+        def record_spawn():
+            worker = spawn()
+            self.spawned.append(worker)
+            return worker
+
+        self.pool._spawn = record_spawn
+
+    def tearDown(self):
+        for worker in self.spawned:
+            if worker.poll() is None:
+                _PythonWorkerPool._discard(worker)
+
+    def assertReaped(self, worker):
+        self.assertIsNotNone(worker.returncode)
+        self.assertTrue(worker.stdin.closed)
+        self.assertTrue(worker.stdout.closed)
+
+    def test_reply_and_worker_reuse(self):
+        first = self.pool.run("print(1)", 10)
+        second = self.pool.run("import sys; sys.exit(3)", 10)
+        self.assertEqual((first["success"], first["stdout"]), (True, "1\n"))
+        self.assertFalse(second["success"])
+        self.assertEqual(len(self.spawned), 1)
+
+    def test_output_of_child_processes_is_captured(self):
+        result = self.pool.run(
+            "import subprocess, sys\n"
+            "subprocess.run([sys.executable, '-c', 'print(42)'])\n"
+            "print('err', file=sys.stderr)",
+            10
+        )
+        self.assertEqual(result["stdout"], "42\n")
+        self.assertEqual(result["stderr"], "err\n")
+        self.assertEqual(self.pool.run("print(2)", 10)["stdout"], "2\n")
+
+    def test_input_does_not_consume_the_next_request(self):
+        self.assertFalse(self.pool.run("input()", 10)["success"])
+        self.assertEqual(self.pool.run("print(3)", 10)["stdout"], "3\n")
+
+    def test_timeout_kills_and_reaps_the_worker(self):
+        result = self.pool.run("import time; time.sleep(30)", 1)
+        self.assertEqual(result["error"], "Execution timed out")
+        self.assertReaped(self.spawned[0])
+        self.assertEqual(self.pool.run("print(4)", 10)["stdout"], "4\n")
+        self.assertEqual(len(self.spawned), 2)
+
+    def test_crashed_worker_is_reaped_and_respawned(self):
+        result = self.pool.run("import os; os._exit(1)", 10)
+        self.assertEqual(result["error"], "Python worker exited unexpectedly")
+        self.assertReaped(self.spawned[0])
+        self.assertEqual(self.pool.run("print(5)", 10)["stdout"], "5\n")
+        self.assertEqual(len(self.spawned), 2)
+
+
+class ToolManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        self.tools = WorkingToolManager()
+
+
+class TestBinaryFileTools(ToolManagerTestCase):
+    def test_binary_round_trip_is_byte_exact(self):
+        data = bytes(range(256)) + b"\r\n\\n"
+        path = str(self.tmp / "blob.bin")
+        written = self.tools.tool_write_file(path, data, binary=True)
+        self.assertEqual(written["bytes_written"], len(data))
+        self.assertEqual(self.tools.tool_read_file(path, binary=True)["content"], data)
+
+    def test_binary_write_skips_unescaping(self):
+        path = self.tmp / "raw.txt"
+        self.tools.tool_write_file(str(path), "a\\nb", binary=True)
+        self.assertEqual(path.read_bytes(), b"a\\nb")
+
+    def test_text_read_normalizes_newlines_and_sees_later_writes(self):
+        path = self.tmp / "notes.txt"
+        path.write_bytes(b"one\r\ntwo\r")
+        self.assertEqual(self.tools.tool_read_file(str(path))["content"], "one\ntwo\n")
+        self.tools.tool_write_file(str(path), "three", binary=True)
+        self.assertEqual(self.tools.tool_read_file(str(path))["content"], "three")
+
+    def test_missing_file(self):
+        result = self.tools.tool_read_file(str(self.tmp / "nope"), binary=True)
+        self.assertFalse(result["success"])
+
+
+class TestCopyFile(ToolManagerTestCase):
+    def test_copies_bytes_into_new_directories(self):
+        src = self.tmp / "image.png"
+        src.write_bytes(b"\x89PNG\r\n\x1a\n\x00")
+        dst = self.tmp / "out" / "nested" / "copy.png"
+        result = self.tools.tool_copy_file(str(src), str(dst))
+        self.assertTrue(result["success"])
+        self.assertEqual(result["bytes_written"], 9)
+        self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+    def test_overwrite_invalidates_cached_read(self):
+        src, dst = self.tmp / "new.txt", self.tmp / "old.txt"
+        src.write_text("new")
+        dst.write_text("old content")
+        self.assertEqual(self.tools.tool_read_file(str(dst))["content"], "old content")
+        self.tools.tool_copy_file(str(src), str(dst))
+        self.assertEqual(self.tools.tool_read_file(str(dst))["content"], "new")
+
+    def test_missing_source(self):
+        result = self.tools.tool_copy_file(str(self.tmp / "nope"), str(self.tmp / "x"))
+        self.assertEqual(result["error"], f"File not found: {self.tmp / 'nope'}")
+
+
+class TestListDirectory(ToolManagerTestCase):
+    def setUp(self):
+        super().setUp()
+        for name in ("c.txt", "a.txt", "b.txt"):
+            (self.tmp / name).write_text(name)
+        (self.tmp / "sub").mkdir()
+
+    def test_pages_cover_every_entry_once(self):
+        seen, offset = [], 0
+        while True:
+            page = self.tools.tool_list_directory(str(self.tmp), offset=offset, limit=1)
+            self.assertTrue(page["success"])
+            seen.extend(page["entries"])
+            if not page["truncated"]:
+                break
+            offset = page["next_offset"]
+        self.assertEqual(sorted(seen), ["a.txt", "b.txt", "c.txt", "sub/"])
+
+    def test_exact_fit_is_not_truncated(self):
+        page = self.tools.tool_list_directory(str(self.tmp), limit=4)
+        self.assertFalse(page["truncated"])
+        self.assertNotIn("next_offset", page)
+
+    def test_sorted_listing(self):
+        page = self.tools.tool_list_directory(str(self.tmp), offset=1, limit=2, sort=True)
+        self.assertEqual(page["entries"], ["b.txt", "c.txt"])
+        self.assertEqual(page["next_offset"], 3)
+
+    def test_invalid_arguments(self):
+        self.assertFalse(self.tools.tool_list_directory(str(self.tmp), limit=0)["success"])
+        self.assertFalse(self.tools.tool_list_directory(str(self.tmp), offset=-1)["success"])
+        missing = self.tools.tool_list_directory(str(self.tmp / "nope"))
+        self.assertTrue(missing["error"].startswith("Directory not found"))
+
+
+class _RecordingTools:
+    """Stand-in tool manager that logs when each call starts and ends."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def execute_tool(self, tool_name, tool_args):
+        with self._lock:
+            self.events.append(("start", tool_name))
+        time.sleep(0.05)
+        with self._lock:
+            self.events.append(("end", tool_name))
+        return {"success": True, "message": tool_name}
+
+
+class TestParallelToolCalls(unittest.TestCase):
+    def run_calls(self, calls):
+        assistant = WorkingAIAssistant.__new__(WorkingAIAssistant)
+        assistant.console = None
+        assistant.tool_manager = _RecordingTools()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = assistant._execute_tools_parallel(calls)
+        self.assertEqual([r["tool"] for r in results], [name for name, _ in calls])
+        return assistant.tool_manager.events
+
+    def test_read_only_calls_overlap(self):
+        events = self.run_calls([
+            ("read_file", "file_path='a.py'"),
+            ("list_directory", "dir_path='.'"),
+            ("read_file", "file_path='b.py'"),
+        ])
+        self.assertEqual([kind for kind, _ in events[:3]], ["start"] * 3)
+
+    def test_side_effecting_calls_are_barriers(self):
+        events = self.run_calls([
+            ("read_file", "file_path='a.py'"),
+            ("run_command", "command='pip install x'"),
+            ("execute_python", "code='import x'"),
+            ("execute_python", "code='print(1)'"),
+            ("write_file", "file_path='b.py', content='x'"),
+            ("read_file", "file_path='b.py'"),
+        ])
+        self.assertEqual(events, [
+            (kind, name)
+            for name in ("read_file", "run_command", "execute_python",
+                         "execute_python", "write_file", "read_file")
+            for kind in ("start", "end")
+        ])
+
+
+class _CountingModel:
+    """Stand-in model that answers every request with a numbered reply."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create_chat_completion(self, messages, **kwargs):
+        self.calls += 1
+        return {"choices": [{"message": {"content": f"reply {self.calls}"}}]}
+
+
+class TestResponseCache(unittest.TestCase):
+    def make_assistant(self, temperature):
+        with contextlib.redirect_stdout(io.StringIO()):
+            assistant = WorkingAIAssistant(model_path="model.gguf")
+        assistant.config = {"inference": {"temperature": temperature}}
+        assistant.stream_output = False
+        assistant.model = _CountingModel()
+        return assistant
+
+    def ask(self, assistant, prompt):
+        # Same conversation state each time, so identical prompts build identical requests
+        assistant.conversation_history.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            return assistant.generate_response(prompt)
+
+    def test_greedy_repeat_reuses_the_completion(self):
+        assistant = self.make_assistant(0.0)
+        first = self.ask(assistant, "hello")
+        self.assertEqual(self.ask(assistant, "hello"), first)
+        self.assertEqual(assistant.model.calls, 1)
+        self.ask(assistant, "something else")
+        self.assertEqual(assistant.model.calls, 2)
+
+    def test_sampled_requests_are_not_cached(self):
+        assistant = self.make_assistant(0.3)
+        self.assertEqual(self.ask(assistant, "hello"), "reply 1")
+        self.assertEqual(self.ask(assistant, "hello"), "reply 2")
+        self.assertEqual(len(assistant._response_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,41 +6,393 @@ Working AI Assistant - Actually executes tools when AI requests them
 import os
 import sys
 import argparse
+import ast
 import subprocess
 import json
+import hashlib
 import re
 import shlex
+import shutil
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
+import importlib.util
+import itertools
+from collections import OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
-import yaml
 from datetime import datetime
 
-try:
-    from llama_cpp import Llama
-    LLAMA_AVAILABLE = True
-except ImportError:
-    LLAMA_AVAILABLE = False
+# llama_cpp (native library), rich and yaml are imported where they are first
+# used so one-shot --prompt runs don't pay for them up front; only probe here.
+LLAMA_AVAILABLE = importlib.util.find_spec("llama_cpp") is not None
+if not LLAMA_AVAILABLE:
     print("Warning: llama-cpp-python not installed. Model loading will not work.")
 
-try:
-    from rich.console import Console
-    from rich.prompt import Prompt, Confirm
-    from rich.panel import Panel
-    from rich.markdown import Markdown
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+if not RICH_AVAILABLE:
     print("Warning: rich not installed. Terminal output will be plain.")
 
+# Chat messages (user + assistant turns) replayed into each prompt
+_HISTORY_MESSAGES = 6
+
+# Programs tool_run_command may launch, matched on the argv[0] basename (extend conservatively)
+_ALLOWED_COMMANDS = frozenset({"python", "python3", "pip", "pytest", "echo"})
+# Characters that make shlex.split differ from a plain whitespace split
+_SHLEX_QUOTING_RE = re.compile(r'[\'"\\]')
+
+# Below this temperature sampling is effectively greedy, so identical requests
+# produce identical completions and may be served from the response cache
+_DETERMINISTIC_TEMPERATURE = 0.05
+_RESPONSE_CACHE_SIZE = 32
+
+# File content beyond this is cut from the tool feedback sent back to the model
+_FEEDBACK_MAX_CHARS = 2000
+
+# Rule printed around plain-text responses and the tool summary
+_SEP = "=" * 50
+
+# Responses larger than this (or with more code fences) skip Markdown rendering
+_MARKDOWN_MAX_CHARS = 8192
+_MARKDOWN_MAX_FENCES = 6
+
+# Read-only tools that may run side by side when the model emits several calls at
+# once; anything that can change the filesystem or environment runs in order
+_PARALLEL_TOOLS = frozenset({"read_file", "list_directory"})
+
+# Markers that content with literal \n/\t escapes is deliberate (code, markup,
+# comments, other escapes) rather than model output that needs unescaping
+_NO_UNESCAPE_RE = re.compile(
+    r'```|\\begin\{|\\end\{|\\\\|\\"|' r"\\'|\{\\|---"  # code fences, LaTeX, escapes, JSON-ish, YAML
+    r'|import |#include|<\?php|<!DOCTYPE|function |def |class |public class|interface '  # source files
+    r'|# |// |/\* |-- |TODO:|FIXME:|NOTE:'  # comments and annotations
+)
+
+# Maximum number of file reads memoized by WorkingToolManager.tool_read_file
+_FILE_CACHE_SIZE = 64
+
+# Tool calls emitted by the model: [TOOL: tool_name(args)] (compiled once at import)
+_TOOL_RE = re.compile(r'\[TOOL:\s*(\w+)\((.*?)\)\]', re.DOTALL)
+# A lone keyword argument with a quoted value free of escapes: file_path='x.py'
+_SINGLE_ARG_RE = re.compile(r'(\w+)\s*=\s*(?:"([^"\\]*)"|\'([^\'\\]*)\')\s*$')
+# key=value pairs for the lenient fallback parser: a quoted value (which may
+# contain commas) or everything up to the next comma
+_KV_RE = re.compile(r"""(\w+)\s*=\s*("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^,]*)""")
+# One plain (optionally r/u-prefixed) string literal; the group that matched holds
+# the text between the quotes exactly as written. Implicit concatenation and
+# b-strings don't match.
+_STRING_LITERAL_RE = re.compile(
+    r'[rRuU]?(?:'
+    r'"""((?:[^"\\]|\\.|"(?!""))*)"""'
+    r"|'''((?:[^'\\]|\\.|'(?!''))*)'''"
+    r'|"((?:[^"\\\n]|\\.)*)"'
+    r"|'((?:[^'\\\n]|\\.)*)')",
+    re.DOTALL
+)
+
+# Driver for the optional long-lived Python worker: one JSON-encoded snippet per
+# request line, one JSON result per reply line. Each snippet gets fresh globals.
+# The protocol runs on private copies of the pipes: while a snippet runs, fd 1/2
+# point at capture files (so child processes are captured too) and fd 0 at devnull,
+# so nothing the snippet reads or writes can fall out of step with the protocol.
+_PY_WORKER_SOURCE = r"""
+import json, os, sys, tempfile, traceback
+requests, replies = os.fdopen(os.dup(0), "r"), os.fdopen(os.dup(1), "w")
+stderr_fd, null_fd = os.dup(2), os.open(os.devnull, os.O_RDWR)
+os.dup2(null_fd, 0)
+os.dup2(null_fd, 1)
+for line in requests:
+    out, err, ok = tempfile.TemporaryFile(), tempfile.TemporaryFile(), True
+    os.dup2(out.fileno(), 1)
+    os.dup2(err.fileno(), 2)
+    try:
+        exec(compile(json.loads(line), "<string>", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        ok = e.code in (None, 0)
+    except BaseException:
+        traceback.print_exc()
+        ok = False
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    os.dup2(null_fd, 1)
+    os.dup2(stderr_fd, 2)
+    captured = []
+    for f in (out, err):
+        f.seek(0)
+        captured.append(f.read().decode(sys.__stdout__.encoding or "utf-8", "replace"))
+        f.close()
+    replies.write(json.dumps({"ok": ok, "stdout": captured[0], "stderr": captured[1]}) + "\n")
+    replies.flush()
+"""
+
+# Static parts of the system prompt, assembled once at import; the file context goes between them
+_SYSTEM_PROMPT_HEAD = """You are an autonomous AI assistant that executes tools to complete multi-step tasks.
+
+<available_tools>
+1. read_file(file_path, binary=False) - Read contents of a file (binary=True returns raw bytes)
+2. write_file(file_path, content, binary=False) - Write content to a file (IMPORTANT: Use actual newlines (\n), not escaped newlines (\\n) in content; binary=True writes bytes as-is)
+3. create_directory(dir_path) - Create a directory
+4. execute_python(code) OR execute_python(file_path) - Run Python code
+5. run_command(command, timeout, cwd, input) - Execute shell command
+6. list_directory(dir_path='.', offset=0, limit=200) - List entry names in a directory (directories end with /)
+7. copy_file(src, dst) - Copy a file as-is (use instead of read_file + write_file to duplicate files)
+</available_tools>
+
+<workflow>
+1. ANALYZE THE REQUEST
+<request_analysis>
+- Break down the user's query into components
+- Identify required tools and sequence
+- Determine if clarification is needed
+- Plan the complete workflow before starting
+</request_analysis>
+
+2. EXECUTE TOOLS IN SEQUENCE
+<tool_execution>
+- Use [TOOL: tool_name(args)] format
+- Execute tools one after another in the SAME response
+- Don't stop until the task is complete
+- Each tool result will be fed back to you
+- Use ONLY the parameters shown in available_tools
+</tool_execution>
+
+3. MULTI-STEP TASK EXAMPLES
+<multi_step_examples>
+Example 1: "Read file.py and write summary to summary.md"
+[TOOL: read_file(file_path='file.py')]
+[TOOL: write_file(file_path='summary.md', content='Summary of file.py...')]
+
+Example 2: "Create project structure"
+[TOOL: create_directory(dir_path='src')]
+[TOOL: create_directory(dir_path='tests')]
+[TOOL: write_file(file_path='README.md', content='# Project')]
+
+Example 3: "Create and run Python script"
+[TOOL: write_file(file_path='script.py', content='print("test")')]
+[TOOL: execute_python(file_path='script.py')]
+</multi_step_examples>
+</workflow>
+
+Context: """
+
+_SYSTEM_PROMPT_TAIL = """
+
+<critical_guidelines>
+- COMPLETE THE FULL TASK - don't stop after one step
+- Use MULTIPLE tool calls in one response when needed
+- After reading files, immediately use the content
+- DO NOT explain plans - EXECUTE with tool calls
+- Be AUTONOMOUS - chain tools together
+- IMPORTANT: Use ONLY the parameters listed in <available_tools>
+
+EFFICIENCY RULES (CRITICAL):
+- Do NOT write placeholder text like "Summary of..." - Write COMPLETE content immediately
+- Do NOT re-read files you already read - use content from feedback messages
+- PLAN before executing: Count how many tools needed, execute all in ONE iteration if possible
+- Use actual newlines (\n) not escaped newlines (\\n) in write_file content
+- For summaries/documentation, write minimum 150 characters with full details
+- If you read a file, the content will be shown in feedback - DO NOT read it again
+</critical_guidelines>"""
+
+
+def _literal_arg(source, node):
+    """Value of one tool-call argument node.
+
+    Strings are taken as written, without evaluating escapes: write_file content is
+    code, where a '\\n' inside a string literal must stay a backslash-n. Whether
+    model output needs unescaping is decided later by _should_unescape_model_output.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        literal = _STRING_LITERAL_RE.fullmatch(ast.get_source_segment(source, node) or "")
+        if literal:
+            return next(group for group in literal.groups() if group is not None)
+    return ast.literal_eval(node)
+
+
+def _parse_tool_args(args_str):
+    """Parse the keyword arguments of a tool call, e.g. "file_path='a.py', content='''...'''".
+
+    The arguments are parsed as a Python call, which handles triple quotes, nested
+    quotes and escapes in one pass. Anything that isn't valid Python literal syntax
+    falls back to a quote-aware key=value split with string values.
+    """
+    args_str = args_str.strip()
+    if not args_str:
+        return {}
+
+    # Most calls (read_file, create_directory, run_command...) are a single
+    # escape-free quoted keyword argument; match that shape directly
+    single = _SINGLE_ARG_RE.match(args_str)
+    if single:
+        value = single.group(2)
+        return {single.group(1): value if value is not None else single.group(3)}
+
+    try:
+        source = f"f({args_str})"
+        call = ast.parse(source, mode="eval").body
+        return {kw.arg: _literal_arg(source, kw.value) for kw in call.keywords if kw.arg}
+    except (SyntaxError, ValueError):
+        pass
+
+    # One key=value per match; quoted values may contain commas (matched in C)
+    args = {}
+    for match in _KV_RE.finditer(args_str):
+        value = match.group(2).strip()
+
+        # Handle string literals
+        if (value.startswith('"') and value.endswith('"')) or \
+           (value.startswith("'") and value.endswith("'")):
+            value = value[1:-1]
+
+        args[match.group(1)] = value
+    return args
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_config(path, mtime_ns, size):
+    """Parse a YAML config file; cached in-process until its mtime or size changes.
+
+    The returned mapping is shared between callers and must be treated as read-only.
+    """
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _should_unescape_model_output(content):
+    """Determine if content should have escape sequences unescaped.
+
+    Uses heuristics to detect model-generated content vs. files with legitimate
+    literal escape sequences (like code files, LaTeX, etc.).
+    """
+    # Only content with escaped newlines/tabs is a candidate
+    if '\\n' not in content and '\\t' not in content:
+        return False
+
+    # Any code, markup, comment or other-escape marker means the escapes are
+    # probably intentional; one regex scan replaces ~20 substring scans
+    return _NO_UNESCAPE_RE.search(content) is None
+
+
+class _PythonWorkerPool:
+    """Long-lived Python interpreters for execute_python(code=...).
+
+    Workers are started on demand (up to ``size``) and handed out through a queue,
+    so concurrent tool calls each get their own process and nothing pays interpreter
+    startup twice. A worker that times out or dies is discarded and replaced on the
+    next call.
+    """
+
+    def __init__(self, size, cwd):
+        size = size or max(1, (os.cpu_count() or 2) // 2)
+        self.cwd = cwd
+        # Idle workers; None marks a slot whose process hasn't been started yet
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)
+
+    def _spawn(self):
+        return subprocess.Popen(
+            [sys.executable, "-u", "-c", _PY_WORKER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=self.cwd
+        )
+
+    @staticmethod
+    def _discard(worker, reader=None):
+        """Kill a worker, reap it and close its pipes so it leaves no zombie behind."""
+        worker.kill()
+        worker.wait()
+        if reader is not None:
+            # The reply pipe is at EOF now; let the reader thread let go of it
+            reader.join(1)
+        for pipe in (worker.stdin, worker.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def run(self, code, timeout):
+        """Execute a snippet in an idle worker and return the tool result dict."""
+        worker = self._idle.get()
+        try:
+            if worker is not None and worker.poll() is not None:
+                self._discard(worker)
+                worker = None
+            if worker is None:
+                worker = self._spawn()
+
+            reply = []
+            reader = threading.Thread(target=lambda: reply.append(worker.stdout.readline()), daemon=True)
+            try:
+                worker.stdin.write(json.dumps(code) + "\n")
+                worker.stdin.flush()
+                reader.start()
+                reader.join(timeout)
+            except OSError as e:
+                self._discard(worker)
+                worker = None
+                return {"success": False, "error": f"Python worker failed: {e}"}
+
+            if reader.is_alive():
+                # Runaway snippet: kill the worker; its slot is refilled on next use
+                self._discard(worker, reader)
+                worker = None
+                return {"success": False, "error": "Execution timed out"}
+            if not reply or not reply[0]:
+                self._discard(worker)
+                worker = None
+                return {"success": False, "error": "Python worker exited unexpectedly"}
+
+            try:
+                outcome = json.loads(reply[0])
+                return {
+                    "success": outcome["ok"],
+                    "stdout": outcome["stdout"],
+                    "stderr": outcome["stderr"],
+                    "message": "Execution completed"
+                }
+            except (ValueError, KeyError, TypeError):
+                # Out of step with the protocol: never hand this worker out again
+                self._discard(worker)
+                worker = None
+                return {"success": False, "error": "Python worker returned a malformed result"}
+        finally:
+            self._idle.put(worker)
+
+
 class WorkingToolManager:
     """Tool manager that actually executes tools."""
 
-    def __init__(self, console=None):
+    def __init__(self, console=None, reuse_python_worker=False, python_workers=None):
         self.console = console
         self.working_directory = Path.cwd()
+        # Run execute_python(code=...) in a pool of persistent interpreters instead
+        # of a fresh process per call. Faster, but snippets share processes (imports,
+        # cwd, env), so it is opt-in via performance.reuse_python_worker.
+        self.reuse_python_worker = reuse_python_worker
+        self._py_workers = _PythonWorkerPool(python_workers, self.working_directory) if reuse_python_worker else None
+        # absolute path -> (mtime_ns, size, content); LRU order, invalidated on write
+        self._file_cache = OrderedDict()
+        # Reads may run concurrently (context files, background tool calls)
+        self._file_cache_lock = threading.Lock()
+        # tool name -> bound method, built once; the tool set is fixed by the class
+        self._tools = {
+            attr_name[5:]: getattr(self, attr_name)
+            for attr_name in dir(type(self))
+            if attr_name.startswith('tool_') and callable(getattr(self, attr_name))
+        }
+        self._tool_names = sorted(self._tools)
 
     def execute_tool(self, tool_name, tool_args):
         """Execute a tool and return results."""
-        tool_function = getattr(self, f"tool_{tool_name}", None)
+        tool_function = self._tools.get(tool_name)
         if not tool_function:
             return {"success": False, "error": f"Tool '{tool_name}' not found"}
 
@@ -50,15 +402,48 @@ class WorkingToolManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def tool_read_file(self, file_path):
-        """Read contents of a file."""
+    def tool_read_file(self, file_path, binary=False):
+        """Read contents of a file.
+
+        With binary=True the raw bytes are returned without decoding (and bypass
+        the text cache), e.g. for copying images or model files unchanged.
+        """
         try:
             path = Path(file_path)
-            if not path.exists():
+            try:
+                if binary:
+                    # Uncached, so no stat is needed: one open + readall
+                    content = path.read_bytes()
+                    return {
+                        "success": True,
+                        "content": content,
+                        "message": f"Successfully read {len(content)} bytes"
+                    }
+                st = path.stat()
+            except FileNotFoundError:
                 return {"success": False, "error": f"File not found: {file_path}"}
 
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Context files are re-read every turn; serve unchanged ones from the cache
+            key = os.path.abspath(file_path)
+            with self._file_cache_lock:
+                cached = self._file_cache.get(key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    self._file_cache.move_to_end(key)
+                else:
+                    cached = None
+
+            if cached:
+                content = cached[2]
+            else:
+                # One read and one decode, without a TextIOWrapper; newlines are
+                # normalized the way text mode would
+                content = path.read_bytes().decode('utf-8')
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                with self._file_cache_lock:
+                    self._file_cache[key] = (st.st_mtime_ns, st.st_size, content)
+                    if len(self._file_cache) > _FILE_CACHE_SIZE:
+                        self._file_cache.popitem(last=False)
 
             return {
                 "success": True,
@@ -68,20 +453,34 @@ class WorkingToolManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def tool_write_file(self, file_path, content):
-        """Write content to a file."""
+    def tool_write_file(self, file_path, content, binary=False):
+        """Write content to a file.
+
+        With binary=True, bytes content is written as-is (str is encoded as UTF-8)
+        with no escape fixing or newline translation.
+        """
         try:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_cache_lock:
+                self._file_cache.pop(os.path.abspath(file_path), None)
+
+            if binary:
+                data = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+                path.write_bytes(data)
+                return {
+                    "success": True,
+                    "message": f"Successfully wrote {len(data)} bytes to {file_path}",
+                    "bytes_written": len(data)
+                }
 
             # Conditionally fix escaped characters from model output
             # Only unescape if content appears to be model-generated (contains \\n/\\t but lacks
             # contexts where literal escapes are common like code blocks, LaTeX, etc.)
-            if self._should_unescape_model_output(content):
+            if _should_unescape_model_output(content):
                 content = content.replace('\\n', '\n').replace('\\t', '\t')
 
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            path.write_text(content, encoding='utf-8')
 
             return {
                 "success": True,
@@ -91,6 +490,31 @@ class WorkingToolManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def tool_copy_file(self, src, dst):
+        """Copy a file byte-for-byte without reading it into Python.
+
+        shutil.copyfile uses the OS fast path where there is one (sendfile on
+        Linux, fcopyfile on macOS), so nothing is decoded or re-encoded.
+        """
+        try:
+            dst_path = Path(dst)
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_cache_lock:
+                self._file_cache.pop(os.path.abspath(dst), None)
+
+            shutil.copyfile(src, dst_path)
+            size = dst_path.stat().st_size
+
+            return {
+                "success": True,
+                "message": f"Successfully copied {src} to {dst} ({size} bytes)",
+                "bytes_written": size
+            }
+        except FileNotFoundError:
+            return {"success": False, "error": f"File not found: {src}"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def tool_create_directory(self, dir_path):
         """Create a directory."""
         try:
@@ -104,6 +528,47 @@ class WorkingToolManager:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def tool_list_directory(self, dir_path=".", offset=0, limit=200, sort=False):
+        """List the entries of a directory, one bounded page at a time.
+
+        Names come straight from os.scandir (no Path objects) in directory order;
+        directories get a trailing '/'. Only offset + limit + 1 entries are read,
+        so huge directories stay cheap. sort=True reads and sorts every entry first.
+        """
+        try:
+            offset = int(offset)
+            limit = int(limit)
+            if offset < 0 or limit <= 0:
+                return {"success": False, "error": "offset must be >= 0 and limit > 0"}
+
+            with os.scandir(dir_path) as it:
+                names = (
+                    f"{entry.name}/" if entry.is_dir() else entry.name
+                    for entry in it
+                )
+                if sort:
+                    entries = sorted(names)[offset:offset + limit + 1]
+                else:
+                    entries = list(itertools.islice(names, offset, offset + limit + 1))
+
+            truncated = len(entries) > limit
+            if truncated:
+                del entries[limit:]
+
+            result = {
+                "success": True,
+                "entries": entries,
+                "truncated": truncated,
+                "message": f"Listed {len(entries)} entries in {dir_path}"
+            }
+            if truncated:
+                result["next_offset"] = offset + limit
+            return result
+        except FileNotFoundError:
+            return {"success": False, "error": f"Directory not found: {dir_path}"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def tool_execute_python(self, code=None, file_path=None, timeout=30):
         """Execute Python code."""
         try:
@@ -118,6 +583,8 @@ class WorkingToolManager:
                     timeout=timeout,
                     cwd=self.working_directory
                 )
+            elif code and self._py_workers:
+                return self._py_workers.run(code, timeout)
             elif code:
                 result = subprocess.run(
                     [sys.executable, "-c", code],
@@ -160,14 +627,14 @@ class WorkingToolManager:
             if input is not None and not isinstance(input, str):
                 return {"success": False, "error": "input must be a string or None"}
 
-            parts = shlex.split(command)
+            # shlex is a pure-Python tokenizer; without quotes or backslashes it
+            # splits exactly like str.split, which runs in C
+            parts = shlex.split(command) if _SHLEX_QUOTING_RE.search(command) else command.split()
             if not parts:
                 return {"success": False, "error": "Empty command"}
 
-            # Allow‑list of programs (extend conservatively)
-            allowed = {"python", "python3", "pip", "pytest", "echo"}
             prog = Path(parts[0]).name.lower()
-            if prog not in allowed:
+            if prog not in _ALLOWED_COMMANDS:
                 return {"success": False, "error": f"Command '{prog}' is not allowed"}
 
             # Determine working directory
@@ -198,34 +665,61 @@ class WorkingToolManager:
 
     def get_available_tools(self):
         """Return available tools."""
-        tools = []
-        for attr_name in dir(self):
-            if attr_name.startswith('tool_'):
-                tool_name = attr_name[5:]
-                method = getattr(self, attr_name)
-                if callable(method):
-                    tools.append(tool_name)
-        return sorted(tools)
+        return list(self._tool_names)
 
 class WorkingAIAssistant:
     """AI Assistant that actually executes tools."""
 
+    # Loaded models shared by every assistant in the process, keyed by file and
+    # load parameters. A llama.cpp context is not safe for concurrent generation,
+    # so assistants sharing a model must not generate at the same time.
+    _MODEL_CACHE = {}
+    _MODEL_CACHE_LOCK = threading.Lock()
+
     def __init__(self, model_path=None, config_path=None):
-        self.console = Console() if RICH_AVAILABLE else None
+        if RICH_AVAILABLE:
+            from rich.console import Console
+            self.console = Console()
+        else:
+            self.console = None
         self.model = None
         self.config = self.load_config(config_path)
         self.model_path = model_path or self.config.get('model', {}).get('path', 'models/Qwen2.5-Coder-7B-Instruct-Q4_K_M.gguf')
-        self.context_files = []
-        self.tool_manager = WorkingToolManager(self.console)
+        # Insertion-ordered set of context paths (dict keys): O(1) add/remove, no duplicates
+        self.context_files = {}
+        self.tool_manager = WorkingToolManager(
+            self.console,
+            reuse_python_worker=self.config.get('performance', {}).get('reuse_python_worker', False),
+            python_workers=self.config.get('performance', {}).get('python_workers')
+        )
         self.auto_confirm = False
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=_HISTORY_MESSAGES)
+        # (file paths + contents, joined context) from the last turn; reused while unchanged
+        self._context_cache = ((), "")
+        # Print tokens as they are generated (and run tool calls as soon as they close)
+        # instead of a final response panel; opt-in via cli.streaming
+        self.stream_output = self.config.get('cli', {}).get('streaming', False)
+        # digest of (model, messages, sampling args) -> response text; LRU order,
+        # only used for (near-)greedy sampling where output is deterministic
+        self._response_cache = OrderedDict()
+        # Print responses as plain text, bypassing Rich (--raw); piped stdout always is
+        self.raw_output = not sys.stdout.isatty()
+        # Per-step progress lines ("Step N", "Generated N characters"); off by default
+        self.verbose = self.config.get('cli', {}).get('verbose', False)
+        # Runs auto-confirmed tool calls while the model keeps decoding. A single
+        # worker keeps calls in order (a write_file must land before a later read_file).
+        self._tool_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tool")
+        # Run independent tool calls from one response concurrently; only applies
+        # with streaming off (streamed calls run one by one as they close)
+        self.parallel_tool_calls = self.config.get('performance', {}).get('parallel_tool_calls', False)
 
     def load_config(self, config_path):
         """Load configuration from YAML file."""
         if config_path and Path(config_path).exists():
             try:
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                config_file = Path(config_path).resolve()
+                st = config_file.stat()
+                return _load_yaml_config(str(config_file), st.st_mtime_ns, st.st_size)
             except Exception as e:
                 self.print_error(f"Failed to load config: {e}")
                 return {}
@@ -238,6 +732,12 @@ class WorkingAIAssistant:
         else:
             print(message)
 
+    def _print_progress(self, message):
+        """Print an agent-loop progress line in verbose mode (plain write, no Rich)."""
+        if self.verbose:
+            sys.stdout.write(f"{message}\n")
+            sys.stdout.flush()
+
     def print_error(self, message):
         """Print an error message."""
         if self.console:
@@ -262,6 +762,7 @@ class WorkingAIAssistant:
     def _ask_confirm(self, prompt, default=True):
         """Ask for user confirmation with fallback to plain input if Rich unavailable."""
         if RICH_AVAILABLE and self.console:
+            from rich.prompt import Confirm
             return Confirm.ask(prompt, default=default)
         try:
             resp = input(f"{prompt} [{'Y/n' if default else 'y/N'}]: ").strip().lower()
@@ -283,26 +784,52 @@ class WorkingAIAssistant:
             return False
 
         try:
+            from llama_cpp import Llama, LlamaRAMCache
+
             # Get inference parameters from config with fallback defaults
             inference_config = self.config.get('inference', {})
             model_settings = self.config.get('model_settings', {})
 
             # Support both old and new config keys for backward compatibility
             n_ctx = inference_config.get('n_ctx', model_settings.get('context_length', 4096))
-            n_threads = inference_config.get('n_threads', 0)
+            # 0 means auto: use half the logical CPUs, roughly the physical core count
+            n_threads = inference_config.get('n_threads', 0) or max(1, (os.cpu_count() or 2) // 2)
             n_batch = inference_config.get('n_batch', 512)
             verbose = inference_config.get('verbose', False)
 
-            self.print_message(f"🧠 Loading model: {model_file.name}")
-            self.print_message(f"   Context: {n_ctx} tokens, Threads: {n_threads if n_threads > 0 else 'auto'}, Batch: {n_batch}")
-
-            self.model = Llama(
-                model_path=str(model_file),
-                n_ctx=n_ctx,
-                n_threads=n_threads,
-                n_batch=n_batch,
-                verbose=verbose
-            )
+            use_mmap = inference_config.get('use_mmap', True)
+            use_mlock = inference_config.get('use_mlock', False)
+            n_gpu_layers = inference_config.get('n_gpu_layers', 0)
+
+            key = (str(model_file.resolve()), n_ctx, n_threads, n_batch, use_mmap, use_mlock, n_gpu_layers)
+            with self._MODEL_CACHE_LOCK:
+                model = self._MODEL_CACHE.get(key)
+                if model is not None:
+                    self.model = model
+                    self.print_success(f"Reusing loaded model: {model_file.name}")
+                    return True
+
+                self.print_message(f"🧠 Loading model: {model_file.name}")
+                self.print_message(f"   Context: {n_ctx} tokens, Threads: {n_threads}, Batch: {n_batch}")
+
+                self.model = Llama(
+                    model_path=str(model_file),
+                    n_ctx=n_ctx,
+                    n_threads=n_threads,
+                    n_batch=n_batch,
+                    use_mmap=use_mmap,
+                    use_mlock=use_mlock,
+                    n_gpu_layers=n_gpu_layers,
+                    verbose=verbose
+                )
+                # llama.cpp already reuses the KV cache for the prefix shared with the
+                # previous call. The opt-in RAM cache also keeps earlier prompt states
+                # (so a model shared by several assistants doesn't re-prefill on each
+                # switch), at the cost of copying the whole KV state after every call.
+                cache_mb = inference_config.get('prompt_cache_mb', 0)
+                if cache_mb:
+                    self.model.set_cache(LlamaRAMCache(capacity_bytes=cache_mb << 20))
+                self._MODEL_CACHE[key] = self.model
             self.print_success("Model loaded successfully!")
             return True
         except Exception as e:
@@ -312,92 +839,15 @@ class WorkingAIAssistant:
     def parse_and_execute_tools(self, response):
         """Parse tool calls from AI response and execute them."""
         # Pattern to match tool calls: [TOOL: tool_name(args)]
-        tool_pattern = r'\[TOOL:\s*(\w+)\((.*?)\)\]'
-        matches = re.findall(tool_pattern, response, re.DOTALL)
+        matches = _TOOL_RE.findall(response)
+
+        if self.auto_confirm and self.parallel_tool_calls and len(matches) > 1:
+            return self._execute_tools_parallel(matches)
 
         results = []
         for tool_name, args_str in matches:
             try:
-                # Parse arguments
-                args = {}
-                if args_str.strip():
-                    args_str = args_str.strip()
-
-                    # Check for triple-quoted content
-                    if "'''" in args_str or '"""' in args_str:
-                        # Determine which quote type
-                        quote_type = "'''" if "'''" in args_str else '"""'
-
-                        # Split on triple quotes
-                        parts = args_str.split(quote_type, 2)
-                        if len(parts) >= 3:
-                            before_content = parts[0]
-                            content = parts[1]
-
-                            # First, parse any simple parameters BEFORE the triple-quoted content
-                            # Example: "file_path='test.py', content='''"
-                            # We want to extract file_path='test.py'
-                            if before_content.strip():
-                                # Remove trailing comma and parameter name for the triple-quoted param
-                                # Match pattern like: "file_path='value', content=" or "file_path='value',content="
-                                simple_params_match = re.match(r'(.*?),?\s*\w+\s*=\s*$', before_content)
-                                if simple_params_match:
-                                    simple_params_str = simple_params_match.group(1)
-                                    # Parse the simple parameters
-                                    pairs = [p.strip() for p in simple_params_str.split(',') if p.strip()]
-                                    for pair in pairs:
-                                        if '=' in pair:
-                                            key, value = pair.split('=', 1)
-                                            key = key.strip()
-                                            value = value.strip()
-                                            # Remove quotes from string literals
-                                            if (value.startswith('"') and value.endswith('"')) or \
-                                               (value.startswith("'") and value.endswith("'")):
-                                                value = value[1:-1]
-                                            args[key] = value
-
-                                # Extract the parameter name for the triple-quoted content
-                                param_match = re.search(r'(\w+)\s*=\s*$', before_content.strip())
-                                if param_match:
-                                    param_name = param_match.group(1)
-                                    args[param_name] = content  # Store content without triple quotes
-                    else:
-                        # Simple key=value parsing for regular arguments (no triple quotes)
-                        # Smart split that respects quotes
-                        pairs = []
-                        current_pair = ""
-                        in_quote = False
-                        quote_char = None
-
-                        for char in args_str:
-                            if char in ['"', "'"] and (not in_quote or char == quote_char):
-                                in_quote = not in_quote
-                                quote_char = char if in_quote else None
-                                current_pair += char
-                            elif char == ',' and not in_quote:
-                                if current_pair.strip():
-                                    pairs.append(current_pair.strip())
-                                current_pair = ""
-                            else:
-                                current_pair += char
-
-                        # Add last pair
-                        if current_pair.strip():
-                            pairs.append(current_pair.strip())
-
-                        # Parse each pair
-                        for pair in pairs:
-                            if '=' in pair:
-                                key, value = pair.split('=', 1)
-                                key = key.strip()
-                                value = value.strip()
-
-                                # Handle string literals
-                                if (value.startswith('"') and value.endswith('"')) or \
-                                   (value.startswith("'") and value.endswith("'")):
-                                    value = value[1:-1]
-
-                                args[key] = value
+                args = _parse_tool_args(args_str)
 
                 # Confirm before executing
                 if not self.auto_confirm:
@@ -409,12 +859,7 @@ class WorkingAIAssistant:
                 # Execute the tool
                 result = self.tool_manager.execute_tool(tool_name, args)
                 results.append({"tool": tool_name, "result": result})
-
-                # Show result
-                if result["success"]:
-                    self.print_success(f"✅ {tool_name}: {result.get('message', 'Success')}")
-                else:
-                    self.print_error(f"❌ {tool_name}: {result.get('error', 'Failed')}")
+                self._report_tool_result(tool_name, result)
 
             except Exception as e:
                 self.print_error(f"❌ Failed to execute tool {tool_name}: {e}")
@@ -422,93 +867,173 @@ class WorkingAIAssistant:
 
         return results
 
-    def generate_response(self, prompt):
-        """Generate response and execute tools."""
-        if not self.model:
-            self.print_error("Model not loaded")
-            return ""
+    def _execute_tools_parallel(self, matches):
+        """Run auto-confirmed tool calls concurrently, keeping results in call order.
 
-        # Build context
-        context = ""
-        for file_path in self.context_files:
-            result = self.tool_manager.execute_tool("read_file", {"file_path": str(file_path)})
-            if result["success"]:
-                context += f"\n--- File: {file_path} ---\n{result['content']}\n--- End of File ---\n"
+        Consecutive read_file/list_directory calls run together; any other call
+        (write_file, execute_python, run_command, ...) waits for the calls before it
+        and finishes before later ones start, so side effects keep their ordering.
+        """
+        calls = []  # (tool_name, future or parse error)
+        with ThreadPoolExecutor(max_workers=min(4, len(matches)), thread_name_prefix="tool") as pool:
+            batch = []
+            for tool_name, args_str in matches:
+                try:
+                    args = _parse_tool_args(args_str)
+                except Exception as e:
+                    calls.append((tool_name, e))
+                    continue
 
-        # System prompt with tool instructions (structured with XML tags)
-        system_message = f"""You are an autonomous AI assistant that executes tools to complete multi-step tasks.
+                if tool_name not in _PARALLEL_TOOLS:
+                    wait(batch)
+                    batch = []
+                future = pool.submit(self.tool_manager.execute_tool, tool_name, args)
+                calls.append((tool_name, future))
+                if tool_name in _PARALLEL_TOOLS:
+                    batch.append(future)
+                else:
+                    wait([future])
 
-<available_tools>
-1. read_file(file_path) - Read contents of a file
-2. write_file(file_path, content) - Write content to a file (IMPORTANT: Use actual newlines (\n), not escaped newlines (\\n) in content)
-3. create_directory(dir_path) - Create a directory
-4. execute_python(code) OR execute_python(file_path) - Run Python code
-5. run_command(command, timeout, cwd, input) - Execute shell command
-</available_tools>
+        results = []
+        for tool_name, outcome in calls:
+            if isinstance(outcome, Exception):
+                self.print_error(f"❌ Failed to execute tool {tool_name}: {outcome}")
+                results.append({"tool": tool_name, "error": str(outcome)})
+                continue
+            result = outcome.result()
+            results.append({"tool": tool_name, "result": result})
+            self._report_tool_result(tool_name, result)
+        return results
 
-<workflow>
-1. ANALYZE THE REQUEST
-<request_analysis>
-- Break down the user's query into components
-- Identify required tools and sequence
-- Determine if clarification is needed
-- Plan the complete workflow before starting
-</request_analysis>
+    def _report_tool_result(self, tool_name, result):
+        """Print the one-line outcome of a tool call."""
+        if result["success"]:
+            self.print_success(f"✅ {tool_name}: {result.get('message', 'Success')}")
+        else:
+            self.print_error(f"❌ {tool_name}: {result.get('error', 'Failed')}")
 
-2. EXECUTE TOOLS IN SEQUENCE
-<tool_execution>
-- Use [TOOL: tool_name(args)] format
-- Execute tools one after another in the SAME response
-- Don't stop until the task is complete
-- Each tool result will be fed back to you
-- Use ONLY the parameters shown in available_tools
-</tool_execution>
+    def _write_token(self, token):
+        """Write one streamed token to the terminal without a trailing newline."""
+        if self.console and not self.raw_output:
+            self.console.print(token, end="", markup=False, highlight=False, soft_wrap=True)
+        else:
+            sys.stdout.write(token)
+            sys.stdout.flush()
 
-3. MULTI-STEP TASK EXAMPLES
-<multi_step_examples>
-Example 1: "Read file.py and write summary to summary.md"
-[TOOL: read_file(file_path='file.py')]
-[TOOL: write_file(file_path='summary.md', content='Summary of file.py...')]
+    def _stream_completion(self, messages, **kwargs):
+        """Stream a chat completion to the terminal, executing each tool call as soon
+        as its closing bracket arrives rather than after the whole response.
 
-Example 2: "Create project structure"
-[TOOL: create_directory(dir_path='src')]
-[TOOL: create_directory(dir_path='tests')]
-[TOOL: write_file(file_path='README.md', content='# Project')]
+        With auto-confirm on, tool calls run on a background worker while decoding
+        continues; otherwise they run inline so the confirmation prompt can be shown.
 
-Example 3: "Create and run Python script"
-[TOOL: write_file(file_path='script.py', content='print("test")')]
-[TOOL: execute_python(file_path='script.py')]
-</multi_step_examples>
-</workflow>
+        Returns (response_text, tool_results).
+        """
+        parts = []
+        tool_results = []
+        pending = []  # (tool_name, future) for tools submitted to the background worker
+        # Unscanned tail of the response: from the start of an unfinished tool call, or
+        # the last few characters (a "[TOOL" split across tokens). Only this window is
+        # rescanned, so long responses aren't re-joined and re-searched on every token.
+        window = ""
+
+        for chunk in self.model.create_chat_completion(messages, stream=True, **kwargs):
+            token = chunk['choices'][0]['delta'].get('content')
+            if not token:
+                continue
+            parts.append(token)
+            self._write_token(token)
+
+            window += token
+            if ')]' in window[-len(token) - 1:]:
+                scan_pos = 0
+                for match in _TOOL_RE.finditer(window):
+                    scan_pos = match.end()
+                    if self.auto_confirm:
+                        tool_name, args_str = match.groups()
+                        try:
+                            args = _parse_tool_args(args_str)
+                        except Exception as e:
+                            pending.append((tool_name, e))
+                            continue
+                        pending.append((tool_name, self._tool_pool.submit(
+                            self.tool_manager.execute_tool, tool_name, args)))
+                    else:
+                        self._write_token("\n")
+                        tool_results.extend(self.parse_and_execute_tools(match.group(0)))
+                window = window[scan_pos:]
+            call_start = window.find("[TOOL")
+            window = window[call_start:] if call_start >= 0 else window[-len("[TOOL") + 1:]
 
-Context: {context if context else "No files in context."}
+        self._write_token("\n")
 
-<critical_guidelines>
-- COMPLETE THE FULL TASK - don't stop after one step
-- Use MULTIPLE tool calls in one response when needed
-- After reading files, immediately use the content
-- DO NOT explain plans - EXECUTE with tool calls
-- Be AUTONOMOUS - chain tools together
-- IMPORTANT: Use ONLY the parameters listed in <available_tools>
+        # The worker runs calls one at a time in emission order, so a read_file
+        # after a write_file sees the new content; report them in that order too
+        for tool_name, outcome in pending:
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                result = outcome.result()
+            except Exception as e:
+                self.print_error(f"❌ Failed to execute tool {tool_name}: {e}")
+                tool_results.append({"tool": tool_name, "error": str(e)})
+                continue
+            tool_results.append({"tool": tool_name, "result": result})
+            self._report_tool_result(tool_name, result)
 
-EFFICIENCY RULES (CRITICAL):
-- Do NOT write placeholder text like "Summary of..." - Write COMPLETE content immediately
-- Do NOT re-read files you already read - use content from feedback messages
-- PLAN before executing: Count how many tools needed, execute all in ONE iteration if possible
-- Use actual newlines (\n) not escaped newlines (\\n) in write_file content
-- For summaries/documentation, write minimum 150 characters with full details
-- If you read a file, the content will be shown in feedback - DO NOT read it again
-</critical_guidelines>"""
+        return "".join(parts).strip(), tool_results
 
-        # Create messages
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": prompt}
-        ]
+    def _response_cache_key(self, messages, completion_args):
+        """Digest of everything that determines a greedy completion."""
+        payload = json.dumps([self.model_path, messages, completion_args], sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
 
-        # Add conversation history
-        for exchange in self.conversation_history[-6:]:
-            messages.append(exchange)
+    def _read_context_file(self, file_path):
+        """Read one context file through the tool manager (and its mtime cache)."""
+        return self.tool_manager.execute_tool("read_file", {"file_path": file_path})
+
+    def generate_response(self, prompt):
+        """Generate response and execute tools."""
+        if not self.model:
+            self.print_error("Model not loaded")
+            return ""
+
+        # Build context; several files are read in parallel (map keeps their order)
+        paths = [str(file_path) for file_path in self.context_files]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                results = list(pool.map(self._read_context_file, paths))
+        else:
+            results = [self._read_context_file(path) for path in paths]
+        loaded = tuple(
+            (path, result['content'])
+            for path, result in zip(paths, results)
+            if result["success"]
+        )
+
+        # Unchanged files come back as the same cached string objects, so this
+        # comparison is an identity check per file
+        if loaded == self._context_cache[0]:
+            context = self._context_cache[1]
+        else:
+            context = "".join(
+                f"\n--- File: {file_path} ---\n{content}\n--- End of File ---\n"
+                for file_path, content in loaded
+            )
+            self._context_cache = (loaded, context)
+
+        # System prompt with tool instructions (structured with XML tags); only the
+        # context varies between turns
+        system_message = f"{_SYSTEM_PROMPT_HEAD}{context if context else 'No files in context.'}{_SYSTEM_PROMPT_TAIL}"
+
+        # Create messages: system, earlier turns, then the new prompt. llama.cpp keeps
+        # the KV cache for the longest token prefix shared with the previous call, so
+        # keeping everything that doesn't change at the front means only the new
+        # turn is prefilled (the old order put the prompt before the history, which
+        # invalidated the cache right after the system message every turn).
+        messages = [{"role": "system", "content": system_message}]
+        messages.extend(self.conversation_history)
+        messages.append({"role": "user", "content": prompt})
 
         try:
             self.print_message("🤔 Thinking...")
@@ -518,43 +1043,70 @@ EFFICIENCY RULES (CRITICAL):
             all_responses = []
             all_tool_results = []
 
+            # Generation parameters are fixed for the whole turn; read them once
+            inference_config = self.config.get('inference', {})
+            performance_config = self.config.get('performance', {})
+
+            max_tokens = inference_config.get('max_tokens', 1024)
+            temperature = inference_config.get('temperature', 0.3)
+            top_p = inference_config.get('top_p', 0.9)
+            top_k = inference_config.get('top_k', 0)
+            repeat_penalty = inference_config.get('repeat_penalty', 1.1)
+
+            # Support both old and new config keys for response timeout
+            response_timeout = performance_config.get('response_timeout_sec', performance_config.get('response_timeout', 60))
+
+            completion_args = dict(
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                repeat_penalty=repeat_penalty,
+                stop=["<|im_end|>"],
+                timeout=response_timeout
+            )
+
             for iteration in range(max_iterations):
                 # Generate response
                 if iteration > 0:
-                    self.print_message(f"🔄 Step {iteration + 1} - Generating response...")
-
-                # Get generation parameters from config
-                inference_config = self.config.get('inference', {})
-                performance_config = self.config.get('performance', {})
-
-                max_tokens = inference_config.get('max_tokens', 1024)
-                temperature = inference_config.get('temperature', 0.3)
-                top_p = inference_config.get('top_p', 0.9)
-                top_k = inference_config.get('top_k', 0)
-                repeat_penalty = inference_config.get('repeat_penalty', 1.1)
-
-                # Support both old and new config keys for response timeout
-                response_timeout = performance_config.get('response_timeout_sec', performance_config.get('response_timeout', 60))
-
-                response = self.model.create_chat_completion(
-                    messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    top_p=top_p,
-                    top_k=top_k,
-                    repeat_penalty=repeat_penalty,
-                    stop=["<|im_end|>"],
-                    timeout=response_timeout
-                )
+                    self._print_progress(f"🔄 Step {iteration + 1} - Generating response...")
+
+                # Greedy decoding is deterministic: an identical request (e.g. a retry
+                # that lands in the same state) can reuse the earlier completion
+                cache_key = None
+                if temperature < _DETERMINISTIC_TEMPERATURE:
+                    cache_key = self._response_cache_key(messages, completion_args)
+                cached = self._response_cache.get(cache_key) if cache_key else None
+
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    ai_response = cached
+                    all_responses.append(ai_response)
+                    if self.stream_output:
+                        self._write_token(f"{ai_response}\n")
+                    self._print_progress(f"📝 Reused cached response ({len(ai_response)} characters)")
+                    tool_results = self.parse_and_execute_tools(ai_response)
+                elif self.stream_output:
+                    # Tools are executed while the response streams in
+                    ai_response, tool_results = self._stream_completion(messages, **completion_args)
+                    all_responses.append(ai_response)
+                    self._print_progress(f"📝 Generated {len(ai_response)} characters")
+                else:
+                    response = self.model.create_chat_completion(messages, **completion_args)
 
-                ai_response = response['choices'][0]['message']['content'].strip()
-                all_responses.append(ai_response)
+                    ai_response = response['choices'][0]['message']['content'].strip()
+                    all_responses.append(ai_response)
 
-                # Debug: Show response length
-                self.print_message(f"📝 Generated {len(ai_response)} characters")
+                    # Debug: Show response length
+                    self._print_progress(f"📝 Generated {len(ai_response)} characters")
 
-                # Parse and execute tools
-                tool_results = self.parse_and_execute_tools(ai_response)
+                    # Parse and execute tools
+                    tool_results = self.parse_and_execute_tools(ai_response)
+
+                if cache_key and cached is None:
+                    self._response_cache[cache_key] = ai_response
+                    if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
 
                 if not tool_results:
                     # No more tools to execute, task complete
@@ -591,13 +1143,29 @@ EFFICIENCY RULES (CRITICAL):
                             # Make it CRYSTAL CLEAR not to re-read
                             # Truncate very long content to prevent context overflow
                             content = tool_result['content']
-                            if len(content) > 2000:
-                                content = content[:2000] + f"\n... (truncated, total {len(tool_result['content'])} chars)"
+                            total = len(content)
+                            if isinstance(content, bytes):
+                                # binary=True read: show a bytes literal the model can pass back;
+                                # slice before repr so a large binary file isn't escaped in full
+                                shown = repr(content[:_FEEDBACK_MAX_CHARS])
+                                unit = "bytes"
+                            else:
+                                shown = content[:_FEEDBACK_MAX_CHARS]
+                                unit = "chars"
+                            if total > _FEEDBACK_MAX_CHARS:
+                                content = f"{shown}\n... (truncated, total {total} {unit})"
+                            else:
+                                content = shown
 
                             feedback_parts.append(
                                 f"📄 File content below (DO NOT re-read this file):\n"
                                 f"---\n{content}\n---"
                             )
+                        elif 'entries' in tool_result:
+                            listing = "\n".join(tool_result['entries'])
+                            if tool_result.get('truncated'):
+                                listing += f"\n... (more entries; use offset={tool_result['next_offset']})"
+                            feedback_parts.append(f"📁 Directory listing:\n{listing}")
                         elif 'stdout' in tool_result:
                             feedback_parts.append(f"✓ Command output:\n{tool_result['stdout']}")
                         else:
@@ -606,11 +1174,12 @@ EFFICIENCY RULES (CRITICAL):
                         error_msg = result.get('result', {}).get('error', 'Unknown error')
                         feedback_parts.append(f"Tool '{tool_name}' failed: {error_msg}")
 
-                feedback = "\n\n".join(feedback_parts) + "\n\nNow complete the remaining steps of the task."
+                feedback_parts.append("Now complete the remaining steps of the task.")
+                feedback = "\n\n".join(feedback_parts)
                 messages.append({"role": "user", "content": feedback})
 
                 # Show progress
-                self.print_message(f"🔄 Step {iteration + 2}...")
+                self._print_progress(f"🔄 Step {iteration + 2}...")
 
             # Combine all responses
             final_response = "\n\n".join(all_responses)
@@ -621,16 +1190,22 @@ EFFICIENCY RULES (CRITICAL):
 
             # Add summary of tool executions
             if all_tool_results:
-                final_response += "\n\n" + "="*50
-                final_response += "\n🔧 Tool Execution Summary:"
+                summary_lines = [_SEP, "🔧 Tool Execution Summary:"]
                 for result in all_tool_results:
+                    tool_result = result.get("result") or {}
                     if result.get("skipped"):
-                        final_response += f"\n⏭️  {result['tool']}: Skipped"
-                    elif result.get("result", {}).get("success"):
-                        final_response += f"\n✅ {result['tool']}: Success"
+                        summary_lines.append(f"⏭️  {result['tool']}: Skipped")
+                    elif tool_result.get("success"):
+                        summary_lines.append(f"✅ {result['tool']}: Success")
                     else:
-                        final_response += f"\n❌ {result['tool']}: {result.get('result', {}).get('error', 'Failed')}"
-                final_response += "\n" + "="*50
+                        summary_lines.append(f"❌ {result['tool']}: {tool_result.get('error', 'Failed')}")
+                summary_lines.append(_SEP)
+                summary = "\n".join(summary_lines)
+                final_response = f"{final_response}\n\n{summary}"
+
+                if self.stream_output:
+                    # The response text is already on screen; show just the summary
+                    self._write_token(f"{summary}\n")
 
             return final_response
 
@@ -643,18 +1218,32 @@ EFFICIENCY RULES (CRITICAL):
         if not response:
             return
 
+        # Piped/scripted output (or --raw) gets the bare text: no panel, no Markdown
+        if self.raw_output:
+            print(response)
+            return
+
         if self.console:
+            from rich.panel import Panel
+            from rich.text import Text
+
+            # Rich's Markdown parser is pure Python; big code dumps are shown as-is
+            if len(response) > _MARKDOWN_MAX_CHARS or response.count("```") > _MARKDOWN_MAX_FENCES:
+                self.console.print(Panel(Text(response), title="🤖 Working AI Response"))
+                return
+
+            from rich.markdown import Markdown
             try:
                 markdown = Markdown(response)
                 self.console.print(Panel(markdown, title="🤖 Working AI Response"))
             except:
                 self.console.print(Panel(response, title="🤖 Working AI Response"))
         else:
-            print("\n" + "="*50)
+            print(f"\n{_SEP}")
             print("AI RESPONSE:")
-            print("="*50)
+            print(_SEP)
             print(response)
-            print("="*50 + "\n")
+            print(f"{_SEP}\n")
 
     def interactive_mode(self):
         """Run interactive mode."""
@@ -663,6 +1252,9 @@ EFFICIENCY RULES (CRITICAL):
         self.print_message("This assistant actually executes tools when requested!")
         self.print_message("-" * 60)
 
+        if self.console:
+            from rich.prompt import Prompt
+
         while True:
             try:
                 if self.console:
@@ -695,9 +1287,10 @@ EFFICIENCY RULES (CRITICAL):
                     self.handle_command(prompt)
                     continue
 
-                # Generate and display response
+                # Generate and display response (streamed output is already shown)
                 response = self.generate_response(prompt)
-                self.display_response(response)
+                if not self.stream_output:
+                    self.display_response(response)
 
             except KeyboardInterrupt:
                 self.print_message("\n👋 Goodbye!")
@@ -729,6 +1322,7 @@ EFFICIENCY RULES (CRITICAL):
         """
 
         if self.console:
+            from rich.panel import Panel
             self.console.print(Panel(help_text, title="📖 Help"))
         else:
             print(help_text)
@@ -744,6 +1338,8 @@ File Operations:
   • read_file(file_path)      - Read file contents
   • write_file(file_path, content) - Write to file
   • create_directory(dir_path) - Create directory
+  • list_directory(dir_path, offset, limit) - List directory entries
+  • copy_file(src, dst)        - Copy a file
 
 Code Execution:
   • execute_python(code or file_path) - Run Python code
@@ -753,6 +1349,7 @@ The AI will use these tools automatically when needed!
         """
 
         if self.console:
+            from rich.panel import Panel
             panel = Panel(tool_info, title="🛠️  Available Tools")
             self.console.print(panel)
         else:
@@ -764,12 +1361,10 @@ The AI will use these tools automatically when needed!
         cmd = parts[0].lower()
 
         if cmd == '/add' and len(parts) > 1:
-            self.context_files.append(Path(parts[1]))
+            self.context_files[Path(parts[1])] = None
             self.print_success(f"Added to context: {parts[1]}")
         elif cmd == '/remove' and len(parts) > 1:
-            path = Path(parts[1])
-            if path in self.context_files:
-                self.context_files.remove(path)
+            if self.context_files.pop(Path(parts[1]), False) is None:
                 self.print_success(f"Removed from context: {parts[1]}")
         elif cmd == '/list':
             if self.context_files:
@@ -792,75 +1387,6 @@ The AI will use these tools automatically when needed!
             self.print_error(f"Unknown command: {command}")
             self.show_help()
 
-    def _should_unescape_model_output(self, content):
-        """Determine if content should have escape sequences unescaped.
-
-        Uses heuristics to detect model-generated content vs. files with legitimate
-        literal escape sequences (like code files, LaTeX, etc.).
-        """
-        # Check if content contains escaped sequences
-        has_escaped_newlines = '\\n' in content
-        has_escaped_tabs = '\\t' in content
-
-        if not (has_escaped_newlines or has_escaped_tabs):
-            return False
-
-        # Heuristics that suggest this is NOT model output (so don't unescape)
-        # 1. Contains code blocks (backticks)
-        if '```' in content:
-            return False
-
-        # 2. Contains LaTeX-like markers
-        if '\\begin{' in content or '\\end{' in content:
-            return False
-
-        # 3. Contains many double backslashes (escaped backslashes)
-        double_backslash_count = content.count('\\\\')
-        if double_backslash_count > 2:
-            return False
-
-        # 4. Contains file format tokens that suggest structured content
-        format_indicators = [
-            '---',  # YAML frontmatter
-            '{\\' ,  # JSON-like
-            'import ',  # Python imports
-            '#include',  # C/C++ includes
-            '<?php',  # PHP
-            '<!DOCTYPE',  # HTML/XML
-            'function ',  # JavaScript/TypeScript
-            'def ',  # Python functions
-            'class ',  # Class definitions
-            'public class',  # Java
-            'interface ',  # Interface definitions
-        ]
-
-        for indicator in format_indicators:
-            if indicator in content:
-                return False
-
-        # 5. Contains explicit metadata flags or comments
-        metadata_indicators = [
-            '# ',  # Comments
-            '// ',  # Comments
-            '/* ',  # Block comments
-            '-- ',  # SQL comments
-            'TODO:',  # TODO comments
-            'FIXME:',  # FIXME comments
-            'NOTE:',  # NOTE comments
-        ]
-
-        for indicator in metadata_indicators:
-            if indicator in content:
-                return False
-
-        # 6. Contains legitimate escape sequences in strings (not just newlines/tabs)
-        # If there are other escapes like \\" or \\', it's likely intentional formatting
-        if '\\"' in content or "\\'" in content or '\\\\' in content:
-            return False
-
-        # If we get here, it looks like model-generated content with escaped newlines/tabs
-        return True
-
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Working AI Assistant - Actually Executes Tools")
@@ -869,6 +1395,8 @@ def main():
     parser.add_argument("--files", "-f", nargs="+", help="Files to add to context")
     parser.add_argument("--prompt", "-p", help="Single prompt mode")
     parser.add_argument("--auto-confirm", action="store_true", help="Auto-confirm tool execution")
+    parser.add_argument("--raw", action="store_true", help="Print responses as plain text (no panels or Markdown)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show per-step progress of the agent loop")
 
     args = parser.parse_args()
 
@@ -877,6 +1405,10 @@ def main():
 
     if args.auto_confirm:
         assistant.auto_confirm = True
+    if args.raw:
+        assistant.raw_output = True
+    if args.verbose:
+        assistant.verbose = True
 
     # Load model
     if not assistant.load_model():
@@ -885,12 +1417,13 @@ def main():
     # Add files to context
     if args.files:
         for file_path in args.files:
-            assistant.context_files.append(Path(file_path))
+            assistant.context_files[Path(file_path)] = None
 
     # Single prompt mode
     if args.prompt:
         response = assistant.generate_response(args.prompt)
-        assistant.display_response(response)
+        if not assistant.stream_output:
+            assistant.display_response(response)
         return
 
     # Interactive mode